@@ -3,18 +3,19 @@ Examples for pdf-sdl
 ====================
 Three complete examples demonstrating SDL in real-world scenarios.
 
-Run:
+Run (from the repository root, with the package installed)::
+
+    pip install -e .
     python examples/examples.py
 """
 
 from __future__ import annotations
 
+import io
 import sys
-import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime, timezone
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from pdf_sdl import (
     DataDefBuilder,
@@ -25,6 +26,10 @@ from pdf_sdl import (
     SDLWriter,
 )
 
+# Validators hold no per-call state, so one instance serves every example.
+_DD_VALIDATOR = DataDefValidator()
+_LM_VALIDATOR = LinkMetaValidator()
+
 
 # ---------------------------------------------------------------------------
 # Example 1: Financial Table
@@ -70,21 +75,20 @@ def example_financial_table() -> None:
     print(f"  Binding: page={datadef.page_ref}, rect={datadef.rect}")
 
     # Validate
-    result = DataDefValidator().validate(datadef)
+    result = _DD_VALIDATOR.validate(datadef)
     print(f"  Validation: {result}")
 
-    # Write to PDF
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-        pdf_path = Path(f.name)
-
+    # Write to PDF (kept in memory)
+    pdf_buf = io.BytesIO()
     with SDLWriter() as writer:
         writer.add_datadef(datadef, page=1)
-        writer.save(pdf_path)
+        writer.save(pdf_buf)
 
-    print(f"  Written to: {pdf_path}")
+    print(f"  Written: {pdf_buf.tell():,} bytes")
 
     # Read back
-    with SDLReader(pdf_path) as reader:
+    pdf_buf.seek(0)
+    with SDLReader(pdf_buf) as reader:
         found = reader.find_datadefs()
         summary = reader.summary()
 
@@ -94,7 +98,6 @@ def example_financial_table() -> None:
         revenue = data["rows"][0]["value"]
         print(f"  Revenue extracted: ${revenue:,}")
 
-    pdf_path.unlink(missing_ok=True)
     print("  ✓ Example 1 complete")
 
 
@@ -149,7 +152,7 @@ def example_link_integrity() -> None:
     print(f"  Persistent IDs:   PID={linkmeta.pid}, LinkID={linkmeta.link_id}")
 
     # Validate
-    result = LinkMetaValidator().validate(linkmeta)
+    result = _LM_VALIDATOR.validate(linkmeta)
     print(f"  Validation: {result}")
 
     # Also show the equivalent DataDef /Link form
@@ -228,7 +231,7 @@ def example_ai_provenance() -> None:
     print(f"  Edited after generation: {data['editedAfterGeneration']}")
 
     # Validate
-    result = DataDefValidator().validate(provenance_dd)
+    result = _DD_VALIDATOR.validate(provenance_dd)
     print(f"  Validation: {result}")
 
     # Classification DataDef (what regulatory regimes apply)
@@ -257,12 +260,25 @@ def example_ai_provenance() -> None:
 # Run all examples
 # ---------------------------------------------------------------------------
 
-if __name__ == "__main__":
-    example_financial_table()
-    example_link_integrity()
-    example_ai_provenance()
+@contextmanager
+def _buffered_stdout() -> Iterator[None]:
+    """Collect printed output and emit it with a single write."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
-    print("\n" + "="*60)
-    print("All examples completed successfully.")
-    print("For more, see: https://github.com/Link-Genetic-Inc/pdf-sdl")
-    print("="*60 + "\n")
+
+if __name__ == "__main__":
+    with _buffered_stdout():
+        example_financial_table()
+        example_link_integrity()
+        example_ai_provenance()
+
+        print("\n" + "="*60)
+        print("All examples completed successfully.")
+        print("For more, see: https://github.com/Link-Genetic-Inc/pdf-sdl")
+        print("="*60 + "\n")
@@ -45,61 +45,70 @@ __author__ = "Christian Nyffenegger, Link Genetic GmbH"
 __spec_version__ = "SDL Technical Specification v1.4.0"
 __issue__ = "PDF Association Issue #725"
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Builders
+from .builder.datadef_builder import DataDefBuilder
+from .builder.linkmeta_builder import LinkMetaBuilder
+
 # Core models
 from .models.datadef import (
+    ClassificationData,
+    CodeData,
+    ConformanceLevel,
     DataDef,
     DataFormat,
     DataType,
-    TrustLevel,
-    ConformanceLevel,
-    LinkData,
+    FindingData,
     FormulaData,
-    CodeData,
-    TimelineData,
-    TimelineEvent,
+    HashValue,
     IdentityData,
-    ClassificationData,
-    ProvenanceData,
-    TranslationData,
+    LicenseData,
+    LinkData,
+    MaterialData,
     MeasurementData,
     MeasurementEntry,
-    HashValue,
-    # New in v1.4.0
+    ObligationData,
     ProcessData,
     ProcessStep,
+    ProvenanceData,
     RiskData,
     RiskEntry,
     StatisticsData,
     StatisticsGroup,
-    FindingData,
-    LicenseData,
-    ObligationData,
-    MaterialData,
+    TimelineData,
+    TimelineEvent,
+    TranslationData,
+    TrustLevel,
 )
 from .models.linkmeta import (
-    LinkMeta,
-    LinkStatus,
     ContentHash,
     HashAlgorithm,
+    LinkMeta,
+    LinkStatus,
 )
 
-# Builders
-from .builder.datadef_builder import DataDefBuilder
-from .builder.linkmeta_builder import LinkMetaBuilder
-
-# PDF I/O
-from .pdf.writer import SDLWriter
-from .pdf.reader import SDLReader
-
 # Validator
 from .validator.conformance import (
     DataDefValidator,
     LinkMetaValidator,
-    ValidationResult,
-    ValidationIssue,
     Severity,
+    ValidationIssue,
+    ValidationResult,
 )
 
+# PDF I/O – imported on first access (see __getattr__), so code that only
+# builds or validates models does not load pikepdf.
+if TYPE_CHECKING:
+    from .pdf.reader import SDLReader
+    from .pdf.writer import SDLWriter
+
+_LAZY = {
+    "SDLWriter": ".pdf.writer",
+    "SDLReader": ".pdf.reader",
+}
+
 __all__ = [
     # Models
     "DataDef",
@@ -147,3 +156,17 @@ __all__ = [
     "ValidationIssue",
     "Severity",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY.keys())
@@ -1,2 +1,4 @@
-from .datadef_builder import DataDefBuilder
+from .datadef_builder import DataDefBuilder, authoring_clock
 from .linkmeta_builder import LinkMetaBuilder
+
+__all__ = ["DataDefBuilder", "LinkMetaBuilder", "authoring_clock"]
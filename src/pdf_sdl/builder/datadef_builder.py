@@ -21,25 +21,107 @@ Example::
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, TypeGuard, cast
 
 from ..models.datadef import (
+    _JSON_ENCODER,
+    _PRETTY_JSON_ENCODER,
+    _SCHEMA_REQUIRED_TYPES,
+    _SCHEMA_URI_MAX,
+    ConformanceLevel,
     DataDef,
     DataFormat,
     DataType,
     TrustLevel,
+    _compute_conformance,
+    _encode_json,
+    _intern,
+    _require_cbor2,
 )
 
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # optional speedup, see the [fast] extra
+    orjson = None
+
+if TYPE_CHECKING:
+    from ..pdf.writer import SDLWriter
+
+_UTC = timezone.utc
+
+# Authoring time pinned for the current context (thread / asyncio task).
+_AUTHORING_TIME: ContextVar[datetime | None] = ContextVar("_AUTHORING_TIME", default=None)
+
+
+@contextmanager
+def authoring_clock(dt: datetime) -> Iterator[datetime]:
+    """
+    Pin the timestamp used by trust_author()/trust_enriched() when no
+    ``created`` is passed, for the duration of the ``with`` block.
+
+    Scoped to the current thread / asyncio task and safe to nest. Useful for
+    reproducible output and for batches that share one logical authoring time.
+    """
+    token = _AUTHORING_TIME.set(dt)
+    try:
+        yield dt
+    finally:
+        _AUTHORING_TIME.reset(token)
+
+
+# Payload type -> whether build() serializes it (True) or stores it as-is.
+# Exact-type lookup first; subclasses fall back to isinstance().
+_STRUCTURED_TYPES: dict[type, bool] = {
+    dict: True,
+    list: True,
+    tuple: True,
+    str: False,
+    bytes: False,
+}
+
+
+def _is_structured(data: Any) -> TypeGuard[dict[str, Any] | list[Any] | tuple[Any, ...]]:
+    structured = _STRUCTURED_TYPES.get(type(data))
+    if structured is None:
+        structured = isinstance(data, (dict, list, tuple))
+    return structured
+
 
 class DataDefBuilder:
     """
     Fluent builder for DataDef objects.
     Typically instantiated via the factory class methods
     (e.g. DataDefBuilder.table()).
+
+    Bulk generators can pin the authoring timestamp for a whole batch with
+    :func:`authoring_clock`.
     """
 
+    __slots__ = (
+        "_data_type",
+        "_format",
+        "_encoding",
+        "_schema_uri",
+        "_schema_version",
+        "_source",
+        "_created",
+        "_generator",
+        "_trust_level",
+        "_confidence",
+        "_struct_ref",
+        "_annot_ref",
+        "_page_ref",
+        "_rect",
+        "_status_uri",
+        "_pretty",
+    )
+
     def __init__(self, data_type: DataType, format: DataFormat = DataFormat.JSON) -> None:
         self._data_type = data_type
         self._format = format
@@ -56,6 +138,7 @@ class DataDefBuilder:
         self._page_ref: int | None = None
         self._rect: tuple[float, float, float, float] | None = None
         self._status_uri: str | None = None
+        self._pretty: bool = False
 
     # ------------------------------------------------------------------
     # Factory methods – 25 DataTypes (SDL Technical Specification v1.4.0)
@@ -211,33 +294,78 @@ class DataDefBuilder:
     def custom(cls, schema_uri: str, format: DataFormat = DataFormat.JSON) -> "DataDefBuilder":
         """Domain-specific data. Requires schema_uri (§4.11)."""
         b = cls(DataType.CUSTOM, format)
-        b._schema_uri = schema_uri
+        b._schema_uri = _intern(schema_uri, _SCHEMA_URI_MAX)
         return b
 
+    # ------------------------------------------------------------------
+    # Templates for bulk generation
+    # ------------------------------------------------------------------
+
+    def freeze_template(self) -> tuple[Any, ...]:
+        """
+        Snapshot the builder's current settings as an immutable template.
+
+        Configure the shared prefix once (schema, source, trust) and stamp
+        out per-row builders with :meth:`from_template`.
+        """
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    @classmethod
+    def from_template(cls, template: tuple[Any, ...]) -> "DataDefBuilder":
+        """Create a builder pre-populated from a :meth:`freeze_template` snapshot."""
+        builder = cls.__new__(cls)
+        # Same __slots__ walk as freeze_template(); strict so a template from
+        # a builder with a different slot layout fails instead of misaligning.
+        for name, value in zip(cls.__slots__, template, strict=True):
+            setattr(builder, name, value)
+        return builder
+
+    @classmethod
+    def table_batch(cls, rows: Any, template: tuple[Any, ...]) -> list[DataDef]:
+        """
+        Build one DataDef per row from a :meth:`freeze_template` snapshot.
+
+        *rows* may be a pyarrow Table (``to_pylist()``), a pandas DataFrame
+        (``to_dict("records")``) or any iterable of dicts. Columnar inputs
+        are converted to row dicts in a single call rather than row by row.
+        """
+        if hasattr(rows, "to_pylist"):
+            records = rows.to_pylist()
+        elif hasattr(rows, "to_dict"):
+            records = rows.to_dict("records")
+        else:
+            records = rows
+        return cls.from_template(template).build_many(records)
+
     # ------------------------------------------------------------------
     # Builder chain methods
     # ------------------------------------------------------------------
 
     def with_source(self, source: str) -> "DataDefBuilder":
         """Origin system or description."""
-        self._source = source
+        self._source = _intern(source)
         return self
 
     def with_schema(
         self, uri: str, version: str | None = None
     ) -> "DataDefBuilder":
         """URI to a formal schema definition. Upgrades to SDL Schema conformance."""
-        self._schema_uri = uri
-        self._schema_version = version
+        self._schema_uri = _intern(uri, _SCHEMA_URI_MAX)
+        self._schema_version = _intern(version)
         return self
 
     def with_encoding(self, encoding: str) -> "DataDefBuilder":
-        self._encoding = encoding
+        self._encoding = _intern(encoding)
         return self
 
     def with_status_uri(self, uri: str) -> "DataDefBuilder":
         """Opt-in live status URI. Never queried automatically."""
-        self._status_uri = uri
+        self._status_uri = _intern(uri)
+        return self
+
+    def with_pretty(self, pretty: bool = True) -> "DataDefBuilder":
+        """Indent the serialized data stream (compact by default)."""
+        self._pretty = pretty
         return self
 
     # --- Trust levels (§6) ---
@@ -252,8 +380,8 @@ class DataDefBuilder:
     ) -> "DataDefBuilder":
         """Mark as Author – created at authoring time."""
         self._trust_level = TrustLevel.AUTHOR
-        self._generator = generator
-        self._created = created or datetime.now(tz=timezone.utc)
+        self._generator = _intern(generator)
+        self._created = created or self._now()
         return self
 
     def trust_enriched(
@@ -263,24 +391,30 @@ class DataDefBuilder:
         created: datetime | None = None,
     ) -> "DataDefBuilder":
         """Mark as Enriched – added post-creation by AI/tools. Requires confidence (0.0–1.0)."""
-        if not 0.0 <= confidence <= 1.0:
+        confidence = float(confidence)
+        if not 0.0 <= confidence <= 1.0:  # also rejects NaN
             raise ValueError("confidence must be between 0.0 and 1.0")
         self._trust_level = TrustLevel.ENRICHED
-        self._generator = generator
+        self._generator = _intern(generator)
         self._confidence = confidence
-        self._created = created or datetime.now(tz=timezone.utc)
+        self._created = created or self._now()
         return self
 
+    @staticmethod
+    def _now() -> datetime:
+        pinned = _AUTHORING_TIME.get()
+        return pinned if pinned is not None else datetime.now(_UTC)
+
     # --- Binding mechanisms (§5) ---
 
     def bind_to_struct(self, object_ref: str) -> "DataDefBuilder":
         """Structure element binding (§5.2) – highest specificity. E.g. '35 0 R'."""
-        self._struct_ref = object_ref
+        self._struct_ref = _intern(object_ref)
         return self
 
     def bind_to_annot(self, object_ref: str) -> "DataDefBuilder":
         """Annotation binding (§5.3) – for Link, Widget, and other annotations."""
-        self._annot_ref = object_ref
+        self._annot_ref = _intern(object_ref)
         return self
 
     def bind_to_page(
@@ -293,30 +427,164 @@ class DataDefBuilder:
         self._rect = rect
         return self
 
+    def bind_to_page_rect(
+        self, page: int, x0: float, y0: float, x1: float, y1: float
+    ) -> "DataDefBuilder":
+        """Spatial binding (§5.4) with the rectangle given as four coordinates."""
+        self._page_ref = page
+        self._rect = (x0, y0, x1, y1)
+        return self
+
     # --- Build ---
 
-    def build(self, data: dict[str, Any] | str | list[Any]) -> DataDef:
+    def build(self, data: dict[str, Any] | str | bytes | list[Any]) -> DataDef:
         """Construct and return the DataDef object."""
-        if isinstance(data, (dict, list)):
-            data_str = json.dumps(data, ensure_ascii=False, indent=2)
+        self._check()
+        return self._finish(data, validate=True)
+
+    def build_unchecked(self, data: dict[str, Any] | str | bytes | list[Any]) -> DataDef:
+        """
+        Construct the DataDef without running pydantic validation.
+
+        For trusted bulk callers whose builder settings are already known to
+        be valid; the builder's own argument checks still apply. Use
+        :meth:`build` for anything derived from untrusted input.
+        """
+        self._check()
+        return self._finish(data, validate=False)
+
+    def build_many(
+        self,
+        records: Iterable[dict[str, Any] | str | bytes | list[Any]],
+        *,
+        validate: bool = True,
+    ) -> list[DataDef]:
+        """
+        Build one DataDef per record, all sharing this builder's settings.
+
+        The settings and conformance level are resolved once for the whole
+        batch, so each record costs one serialization and one model
+        construction. Pass ``validate=False`` for the unchecked fast path.
+        """
+        self._check()
+        shared = self._model_kwargs()
+        conformance = self._conformance()
+        factory = DataDef if validate else DataDef.from_trusted
+        out: list[DataDef] = []
+        append = out.append
+        for record in records:
+            datadef = factory(data=self._payload(record), **shared)
+            datadef._conformance = conformance
+            append(datadef)
+        return out
+
+    def _finish(
+        self, data: dict[str, Any] | str | bytes | list[Any], *, validate: bool
+    ) -> DataDef:
+        """Serialize dict/list payloads and construct the DataDef."""
+        return self._make(self._payload(data), validate=validate)
+
+    def _payload(self, data: dict[str, Any] | str | bytes | list[Any]) -> str | bytes:
+        """Encode a structured payload; str and bytes are stored as-is."""
+        if _is_structured(data):
+            return self._encode(data)
+        # TypeGuard does not narrow the negative branch
+        return cast("str | bytes", data)
+
+    def _encode(self, data: dict[str, Any] | list[Any] | tuple[Any, ...]) -> str | bytes:
+        """Encode a structured payload in the builder's format."""
+        if self._format is DataFormat.CBOR:
+            encoded: bytes = _require_cbor2().dumps(data)
+            return encoded
+        if orjson is not None:
+            return self._dump_bytes(data).decode("utf-8")
+        return self._encode_stdlib(data)
+
+    def _encode_stdlib(self, data: dict[str, Any] | list[Any] | tuple[Any, ...]) -> str:
+        """Encode a JSON payload with the json module (NaN/Infinity -> null)."""
+        return _encode_json(_PRETTY_JSON_ENCODER if self._pretty else _JSON_ENCODER, data)
+
+    def build_into(
+        self,
+        data: dict[str, Any] | str | bytes | list[Any],
+        writer: SDLWriter,
+        *,
+        page: int | None = None,
+        add_to_catalog: bool = True,
+    ) -> DataDef:
+        """
+        Build the DataDef and write it straight into *writer*.
+
+        The payload is serialized to bytes once and those bytes become the
+        PDF data stream, instead of going str -> DataDef -> re-encode in the
+        writer. Returns the built DataDef.
+        """
+        self._check()
+        utf8 = self._encoding.upper() in ("UTF-8", "UTF8")
+        if (
+            _is_structured(data)
+            and self._format is not DataFormat.CBOR
+            and orjson is not None
+            and utf8
+        ):
+            data_bytes = self._dump_bytes(data)
+            datadef = self._make(data_bytes.decode("utf-8"))
         else:
-            data_str = data
-
-        return DataDef(
-            data_type=self._data_type,
-            format=self._format,
-            data=data_str,
-            encoding=self._encoding,
-            schema_uri=self._schema_uri,
-            schema_version=self._schema_version,
-            source=self._source,
-            created=self._created,
-            generator=self._generator,
-            trust_level=self._trust_level,
-            confidence=self._confidence,
-            struct_ref=self._struct_ref,
-            annot_ref=self._annot_ref,
-            page_ref=self._page_ref,
-            rect=self._rect,
-            status_uri=self._status_uri,
+            datadef = self.build(data)
+            data_bytes = None
+        writer.add_datadef(
+            datadef, page=page, add_to_catalog=add_to_catalog, data_bytes=data_bytes
+        )
+        return datadef
+
+    def _check(self) -> None:
+        """Reject invalid settings before paying for payload serialization."""
+        if self._data_type in _SCHEMA_REQUIRED_TYPES and self._schema_uri is None:
+            raise ValueError(
+                f"schema_uri is required when data_type is {self._data_type} (§4.11)"
+            )
+
+    def _dump_bytes(self, data: dict[str, Any] | list[Any] | tuple[Any, ...]) -> bytes:
+        """Serialize *data* to UTF-8 JSON bytes with orjson when it can encode it."""
+        assert orjson is not None  # callers check for the [fast] extra
+        option = orjson.OPT_NON_STR_KEYS
+        if self._pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            encoded: bytes = orjson.dumps(data, option=option)
+            return encoded
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the json module writes as-is
+            return self._encode_stdlib(data).encode("utf-8")
+
+    def _make(self, data_str: str | bytes, *, validate: bool = True) -> DataDef:
+        """Construct the DataDef around an already-serialized payload."""
+        factory = DataDef if validate else DataDef.from_trusted
+        datadef = factory(data=data_str, **self._model_kwargs())
+        datadef._conformance = self._conformance()
+        return datadef
+
+    def _model_kwargs(self) -> dict[str, Any]:
+        """DataDef constructor arguments for everything except the payload."""
+        return {
+            "data_type": self._data_type,
+            "format": self._format,
+            "encoding": self._encoding,
+            "schema_uri": self._schema_uri,
+            "schema_version": self._schema_version,
+            "source": self._source,
+            "created": self._created,
+            "generator": self._generator,
+            "trust_level": self._trust_level,
+            "confidence": self._confidence,
+            "struct_ref": self._struct_ref,
+            "annot_ref": self._annot_ref,
+            "page_ref": self._page_ref,
+            "rect": self._rect,
+            "status_uri": self._status_uri,
+        }
+
+    def _conformance(self) -> ConformanceLevel:
+        return _compute_conformance(
+            self._trust_level, self._schema_uri, self._source, self._created, self._generator
         )
@@ -31,9 +31,31 @@ Example::
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
 
-from ..models.linkmeta import ContentHash, HashAlgorithm, LinkMeta, LinkStatus
+from ..models.linkmeta import ContentHash, HashAlgorithm, LinkMeta, LinkStatus, _make_hash
+
+_ALGO_MAP = {
+    "SHA-256": HashAlgorithm.SHA256,
+    "SHA-384": HashAlgorithm.SHA384,
+    "SHA-512": HashAlgorithm.SHA512,
+}
+
+
+# (epoch second, formatted PDF date) of the most recent _pdf_now() call;
+# replaced as a whole so concurrent callers never see a mismatched pair.
+_last_stamp: tuple[int, str] = (-1, "")
+
+
+def _pdf_now() -> str:
+    """Current UTC time as a PDF date string, formatted at most once per second."""
+    global _last_stamp
+    t = int(time.time())
+    second, stamp = _last_stamp
+    if t != second:
+        stamp = time.strftime("D:%Y%m%d%H%M%S+00'00'", time.gmtime(t))
+        _last_stamp = (t, stamp)
+    return stamp
 
 
 class LinkMetaBuilder:
@@ -41,8 +63,28 @@ class LinkMetaBuilder:
     Fluent builder for LinkMeta dictionaries.
 
     Even a minimal call to .build() produces a valid LinkMeta (§3.3).
+    Unless set via .context(), ref_date is stamped when .build() runs.
     """
 
+    __slots__ = (
+        "_pid",
+        "_link_id",
+        "_title",
+        "_desc",
+        "_lang",
+        "_ref_date",
+        "_content_type",
+        "_hash",
+        "_alt_uris",
+        "_status",
+        "_last_checked",
+        "_status_uri",
+        "_trust_level",
+        "_generator",
+        "_confidence",
+        "_annot_ref",
+    )
+
     def __init__(self) -> None:
         self._pid: str | None = None
         self._link_id: str | None = None
@@ -52,7 +94,7 @@ class LinkMetaBuilder:
         self._ref_date: str | None = None
         self._content_type: str | None = None
         self._hash: ContentHash | None = None
-        self._alt_uris: list[str] = []
+        self._alt_uris: list[str] | None = None  # allocated on first fallback()
         self._status: LinkStatus | None = None
         self._last_checked: str | None = None
         self._status_uri: str | None = None
@@ -60,10 +102,6 @@ class LinkMetaBuilder:
         self._generator: str | None = None
         self._confidence: float | None = None
         self._annot_ref: str | None = None
-        # Auto-stamp ref_date
-        self._ref_date = datetime.now(tz=timezone.utc).strftime(
-            "D:%Y%m%d%H%M%S+00'00'"
-        )
 
     # --- Identification (§3.2) ---
 
@@ -118,13 +156,8 @@ class LinkMetaBuilder:
         hash_value: Hex-encoded hash of the target resource at ref_date.
         algorithm:  SHA-256 (default), SHA-384, or SHA-512.
         """
-        algo_map = {
-            "SHA-256": HashAlgorithm.SHA256,
-            "SHA-384": HashAlgorithm.SHA384,
-            "SHA-512": HashAlgorithm.SHA512,
-        }
-        algo = algo_map.get(algorithm, HashAlgorithm.SHA256)
-        self._hash = ContentHash(algorithm=algo, value=hash_value)
+        algo = _ALGO_MAP.get(algorithm, HashAlgorithm.SHA256)
+        self._hash = _make_hash(algo, hash_value)
         return self
 
     # --- Fallback (§3.2) ---
@@ -134,7 +167,10 @@ class LinkMetaBuilder:
         Add alternative/fallback URIs, ordered by preference.
         Typical sources: Wayback Machine, Perma.cc, national archives.
         """
-        self._alt_uris.extend(uris)
+        if self._alt_uris is None:
+            self._alt_uris = list(uris)
+        else:
+            self._alt_uris.extend(uris)
         return self
 
     # --- Status (§3.2) ---
@@ -142,9 +178,7 @@ class LinkMetaBuilder:
     def status_active(self) -> "LinkMetaBuilder":
         """Mark the referenced resource as currently active."""
         self._status = LinkStatus.ACTIVE
-        self._last_checked = datetime.now(tz=timezone.utc).strftime(
-            "D:%Y%m%d%H%M%S+00'00'"
-        )
+        self._last_checked = _pdf_now()
         return self
 
     def status_archived(self) -> "LinkMetaBuilder":
@@ -191,7 +225,8 @@ class LinkMetaBuilder:
         Added post-creation by AI or tools. Lowest trust.
         Both generator and confidence are required (§7.2).
         """
-        if not 0.0 <= confidence <= 1.0:
+        confidence = float(confidence)
+        if not 0.0 <= confidence <= 1.0:  # also rejects NaN
             raise ValueError("confidence must be between 0.0 and 1.0")
         self._trust_level = "Enriched"
         self._generator = generator
@@ -215,10 +250,10 @@ class LinkMetaBuilder:
             title=self._title,
             desc=self._desc,
             lang=self._lang,
-            RefDate=self._ref_date,
+            RefDate=self._ref_date or _pdf_now(),  # auto-stamp ref_date
             ContentType=self._content_type,
             hash=self._hash,
-            AltURIs=self._alt_uris,
+            AltURIs=self._alt_uris if self._alt_uris is not None else [],
             status=self._status,
             LastChecked=self._last_checked,
             StatusURI=self._status_uri,
@@ -19,16 +19,122 @@ Usage::
 from __future__ import annotations
 
 import json
+import mmap
 import sys
+from functools import cache
+from itertools import chain
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
 
-console = Console()
+from ..builder.datadef_builder import DataDefBuilder
+from ..models.datadef import DataDef, DataType, _loads_json
+from ..models.linkmeta import LinkMeta
+from ..pdf.reader import SDLReader
+from ..pdf.writer import SDLWriter
+from ..validator.conformance import (
+    DataDefValidator,
+    LinkMetaValidator,
+    ValidationIssue,
+    ValidationResult,
+)
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # optional speedup, see the [fast] extra
+    orjson = None
+
+if TYPE_CHECKING:
+    from rich.box import Box
+    from rich.console import Console
+    from rich.table import Table
+
+# --type choice (lower-cased DataType value) -> DataType
+_TYPE_MAP = {t.value.lower(): t for t in DataType}
+
+_SEVERITY_COLOR = {"ERROR": "red", "WARNING": "yellow"}
+
+# Column specs for the rich tables: (header, add_column kwargs)
+_VALIDATE_COLS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("#", {"style": "dim"}),
+    ("DataType", {}),
+    ("Conformance", {}),
+    ("Trust", {}),
+    ("Status", {}),
+    ("Issues", {}),
+)
+_DATADEF_COLS: tuple[tuple[str, dict[str, Any]], ...] = tuple(
+    (name, {}) for name in ("#", "Type", "Format", "Trust", "Conformance", "Binding", "Schema")
+)
+_LINKMETA_COLS: tuple[tuple[str, dict[str, Any]], ...] = tuple(
+    (name, {})
+    for name in ("#", "PID", "LinkID", "Title", "Hash", "Fallbacks", "Status", "Score")
+)
+
+
+# rich is imported on first use so that --json-output runs never load it.
+@cache
+def _console() -> Console:
+    """Return the shared rich Console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _make_table(title: str, cols: tuple[tuple[str, dict[str, Any]], ...], box: Box) -> Table:
+    """Create a rich Table with the given column specs and ``rich.box`` style."""
+    from rich.table import Table
+
+    t = Table(title=title, box=box)
+    for name, kwargs in cols:
+        t.add_column(name, **kwargs)
+    return t
+
+
+def _dumps(obj: Any) -> str:
+    """Indented JSON for CLI output; unknown types fall back to str()."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        encoded: bytes = orjson.dumps(obj, default=str, option=option)
+        return encoded.decode("utf-8")
+    return json.dumps(obj, indent=2, default=str)
+
+
+# Below this size a plain read is cheaper than setting up a mapping.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON file; large files are parsed by orjson from an mmap."""
+    if orjson is not None and path.stat().st_size >= _MMAP_THRESHOLD:
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+        ):
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN or big integers; the json module reads them below
+    return _loads_json(path.read_bytes())
+
+
+def _echo_json(obj: Any) -> None:
+    """Write indented JSON plus newline to stdout."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        click.echo(_dumps(obj))
+        return
+    # orjson produces UTF-8 bytes; write them to the binary stream directly
+    # instead of decoding to str for click.echo() to encode again.
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    sys.stdout.flush()
+    buffer.write(orjson.dumps(obj, default=str, option=option))
+    buffer.flush()
+
 
 
 @click.group()
@@ -59,27 +165,28 @@ def validate(
     json_output: bool,
 ) -> None:
     """Validate SDL conformance of a PDF file."""
-    try:
-        from ..pdf.reader import SDLReader
-        from ..validator.conformance import DataDefValidator, LinkMetaValidator
-    except ImportError as e:
-        console.print(f"[red]Import error: {e}[/red]")
-        sys.exit(2)
-
     results_data: dict = {"file": str(pdf_path), "datadefs": [], "linkmetas": [], "summary": {}}
 
-    with SDLReader(pdf_path) as reader:
-        datadefs = reader.find_datadefs(full_scan=full_scan)
-        linkmetas = reader.find_linkmetas()
-
     dd_validator = DataDefValidator()
     lm_validator = LinkMetaValidator()
+    datadefs: list[DataDef] = []
+    linkmetas: list[LinkMeta] = []
+    dd_results: list[ValidationResult] = []
+    lm_results: list[ValidationResult] = []
+
+    # Validate each object as soon as the reader yields it. The rules are
+    # pure Python and hold the GIL, so interleaving in one thread is as
+    # good as a producer/consumer pair without the queue overhead.
+    with SDLReader(pdf_path) as reader:
+        for dd in reader.iter_datadefs(full_scan=full_scan):
+            datadefs.append(dd)
+            dd_results.append(dd_validator.validate(dd))
+        for lm in reader.iter_linkmetas():
+            linkmetas.append(lm)
+            lm_results.append(lm_validator.validate(lm))
 
-    dd_results = [dd_validator.validate(dd) for dd in datadefs]
-    lm_results = [lm_validator.validate(lm) for lm in linkmetas]
-
-    all_passed = all(r.passed for r in dd_results + lm_results)
-    has_warnings = any(r.warnings for r in dd_results + lm_results)
+    all_passed = all(r.passed for r in chain(dd_results, lm_results))
+    has_warnings = any(r.warnings for r in chain(dd_results, lm_results))
 
     if json_output:
         output = {
@@ -98,9 +205,13 @@ def validate(
                 for r in dd_results
             ],
         }
-        click.echo(json.dumps(output, indent=2))
+        _echo_json(output)
     else:
         # Rich output
+        from rich import box
+        from rich.panel import Panel
+
+        console = _console()
         console.print()
         status_str = "[bold green]PASS[/bold green]" if all_passed else "[bold red]FAIL[/bold red]"
         console.print(Panel(
@@ -112,22 +223,23 @@ def validate(
         ))
 
         if datadefs:
-            t = Table(box=box.SIMPLE, title="DataDef Results")
-            t.add_column("#", style="dim")
-            t.add_column("DataType")
-            t.add_column("Conformance")
-            t.add_column("Trust")
-            t.add_column("Status")
-            t.add_column("Issues")
+            t = _make_table("DataDef Results", _VALIDATE_COLS, box.SIMPLE)
+            # Issue details are printed after the table; collect them in the
+            # same pass instead of walking the results a second time.
+            details: list[tuple[int, str, list[ValidationIssue]]] = []
 
             for i, (dd, r) in enumerate(zip(datadefs, dd_results), 1):
                 status_cell = "[green]✓ PASS[/green]" if r.passed else "[red]✗ FAIL[/red]"
-                issues_str = ", ".join(f"{x.rule_id}" for x in r.issues[:3])
-                if len(r.issues) > 3:
-                    issues_str += f" +{len(r.issues)-3}"
+                issues = r.issues
+                type_name = dd.data_type.value
+                if issues:
+                    details.append((i, type_name, issues))
+                issues_str = ", ".join(x.rule_id for x in issues[:3])
+                if len(issues) > 3:
+                    issues_str += f" +{len(issues)-3}"
                 t.add_row(
                     str(i),
-                    dd.data_type.value,
+                    type_name,
                     r.conformance_level,
                     str(dd.trust_level.value if dd.trust_level else "—"),
                     status_cell,
@@ -136,12 +248,12 @@ def validate(
             console.print(t)
 
             # Detail issues
-            for i, (dd, r) in enumerate(zip(datadefs, dd_results), 1):
-                if r.issues:
-                    console.print(f"\n[bold]DataDef #{i} ({dd.data_type.value}) issues:[/bold]")
-                    for issue in r.issues:
-                        color = "red" if issue.severity.value == "ERROR" else "yellow" if issue.severity.value == "WARNING" else "blue"
-                        console.print(f"  [{color}]{issue.severity.value}[/{color}] [{issue.rule_id}] {issue.message}")
+            for i, type_name, issues in details:
+                console.print(f"\n[bold]DataDef #{i} ({type_name}) issues:[/bold]")
+                for issue in issues:
+                    sev = issue.severity.value
+                    color = _SEVERITY_COLOR.get(sev, "blue")
+                    console.print(f"  [{color}]{sev}[/{color}] [{issue.rule_id}] {issue.message}")
 
         if not datadefs and not linkmetas:
             console.print("\n[yellow]No SDL DataDef or LinkMeta objects found in this PDF.[/yellow]")
@@ -168,12 +280,6 @@ def validate(
 @click.option("--full-scan", is_flag=True)
 def inspect(pdf_path: Path, output_format: str, full_scan: bool) -> None:
     """Inspect all SDL content in a PDF file."""
-    try:
-        from ..pdf.reader import SDLReader
-    except ImportError as e:
-        console.print(f"[red]Import error: {e}[/red]")
-        sys.exit(2)
-
     with SDLReader(pdf_path) as reader:
         summary = reader.summary()
         datadefs = reader.find_datadefs(full_scan=full_scan)
@@ -186,9 +292,13 @@ def inspect(pdf_path: Path, output_format: str, full_scan: bool) -> None:
             "datadefs": [dd.model_dump(mode="json", exclude_none=True) for dd in datadefs],
             "linkmetas": [lm.model_dump(mode="json", exclude_none=True) for lm in linkmetas],
         }
-        click.echo(json.dumps(output, indent=2, default=str))
+        _echo_json(output)
         return
 
+    from rich import box
+    from rich.panel import Panel
+
+    console = _console()
     console.print()
     console.print(Panel(
         f"[bold]{pdf_path.name}[/bold]\n"
@@ -199,14 +309,7 @@ def inspect(pdf_path: Path, output_format: str, full_scan: bool) -> None:
     ))
 
     if datadefs:
-        t = Table(title="DataDef Objects", box=box.ROUNDED)
-        t.add_column("#")
-        t.add_column("Type")
-        t.add_column("Format")
-        t.add_column("Trust")
-        t.add_column("Conformance")
-        t.add_column("Binding")
-        t.add_column("Schema")
+        t = _make_table("DataDef Objects", _DATADEF_COLS, box.ROUNDED)
 
         for i, dd in enumerate(datadefs, 1):
             binding = (
@@ -227,15 +330,7 @@ def inspect(pdf_path: Path, output_format: str, full_scan: bool) -> None:
         console.print(t)
 
     if linkmetas:
-        t = Table(title="LinkMeta Objects", box=box.ROUNDED)
-        t.add_column("#")
-        t.add_column("PID")
-        t.add_column("LinkID")
-        t.add_column("Title")
-        t.add_column("Hash")
-        t.add_column("Fallbacks")
-        t.add_column("Status")
-        t.add_column("Score")
+        t = _make_table("LinkMeta Objects", _LINKMETA_COLS, box.ROUNDED)
 
         for i, lm in enumerate(linkmetas, 1):
             t.add_row(
@@ -254,9 +349,9 @@ def inspect(pdf_path: Path, output_format: str, full_scan: bool) -> None:
         console.print("\n[bold]Data Previews:[/bold]")
         for i, dd in enumerate(datadefs, 1):
             try:
-                data = dd.data_as_dict()
-                preview = json.dumps(data, indent=2)[:300]
-                if len(json.dumps(data)) > 300:
+                blob = _dumps(dd.data_as_dict())
+                preview = blob[:300]
+                if len(blob) > 300:
                     preview += "\n  ... (truncated)"
                 console.print(Panel(
                     preview,
@@ -309,26 +404,17 @@ def inject(
     incremental: bool,
 ) -> None:
     """Inject a DataDef into a PDF file."""
-    try:
-        from ..builder.datadef_builder import DataDefBuilder
-        from ..pdf.writer import SDLWriter
-        from ..models.datadef import DataType
-    except ImportError as e:
-        console.print(f"[red]Import error: {e}[/red]")
-        sys.exit(2)
-
     # Load data
     if data_file:
-        data = json.loads(data_file.read_text(encoding="utf-8"))
+        data = _load_json_file(data_file)
     elif data_inline:
-        data = json.loads(data_inline)
+        data = _loads_json(data_inline)
     else:
-        console.print("[red]Either --data or --data-inline is required[/red]")
+        _console().print("[red]Either --data or --data-inline is required[/red]")
         sys.exit(1)
 
     # Build DataDef
-    type_map = {t.value.lower(): t for t in DataType}
-    dt = type_map.get(data_type.lower(), DataType.CUSTOM)
+    dt = _TYPE_MAP.get(data_type.lower(), DataType.CUSTOM)
 
     builder = DataDefBuilder(dt)
 
@@ -359,6 +445,7 @@ def inject(
         writer.add_datadef(datadef, page=page)
         writer.save(output_path, incremental=incremental)
 
+    console = _console()
     console.print(f"[green]✓[/green] DataDef ({data_type}) injected into [bold]{output_path}[/bold]")
     console.print(f"  Conformance: {datadef.conformance_level().value}")
     console.print(f"  Trust: {datadef.trust_level.value if datadef.trust_level else 'none'}")
@@ -372,7 +459,9 @@ def inject(
 @cli.command("version")
 def show_version() -> None:
     """Show detailed version and specification information."""
-    console.print(Panel(
+    from rich.panel import Panel
+
+    _console().print(Panel(
         "[bold cyan]pdf-sdl[/bold cyan] v0.1.0\n\n"
         "Semantic Data Layer for PDF – Python Reference Implementation\n"
         "Specification: SDL Technical Specification v1.2.0\n"
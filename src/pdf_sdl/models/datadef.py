@@ -10,12 +10,42 @@ and the full type system (§4), now covering 25 standard DataTypes.
 
 from __future__ import annotations
 
+import base64
 import json
+import sys
+import threading
+from contextlib import suppress
 from datetime import datetime
 from enum import Enum
-from typing import Any
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from types import MappingProxyType, ModuleType
+from typing import Any, Literal
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+cbor2: ModuleType | None
+try:
+    import cbor2
+except ImportError:  # optional, see the [cbor] extra
+    cbor2 = None
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # optional speedup, see the [fast] extra
+    orjson = None
+
+simdjson: ModuleType | None
+try:
+    import simdjson
+except ImportError:  # optional speedup, see the [fast] extra
+    simdjson = None
 
 
 # ---------------------------------------------------------------------------
@@ -95,14 +125,22 @@ class ConformanceLevel(str, Enum):
 # Shared sub-models
 # ---------------------------------------------------------------------------
 
-class HashValue(BaseModel):
+class _SDLBase(BaseModel):
+    """
+    Common base for the data stream sub-models.
+
+    Validators are built on first use rather than at import, since most
+    programs only ever touch a few of the 25 DataType schemas.
+    """
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+
+class HashValue(_SDLBase):
     """Content hash of a target resource (used in LinkMeta and /Link DataType)."""
     model_config = ConfigDict(frozen=True)
 
-    algorithm: str = Field(
-        ...,
-        description="Hash algorithm: SHA-256, SHA-384, or SHA-512",
-        pattern=r"^SHA-(256|384|512)$",
+    algorithm: Literal["SHA-256", "SHA-384", "SHA-512"] = Field(
+        ..., description="Hash algorithm"
     )
     value: str = Field(..., description="Hex-encoded hash value")
 
@@ -111,10 +149,8 @@ class HashValue(BaseModel):
 # Sub-models – 25 DataTypes (SDL Technical Specification v1.4.0)
 # ---------------------------------------------------------------------------
 
-class LinkData(BaseModel):
+class LinkData(_SDLBase):
     """JSON data stream schema for /DataType /Link (§4.2.1). Issue #725."""
-    model_config = ConfigDict(populate_by_name=True)
-
     uri: str = Field(..., description="The target URI (same as the URI Action)")
     pid: str | None = Field(None, description="Persistent Identifier (DOI, ARK, Handle, URN)")
     link_id: str | None = Field(None, alias="linkId", description="LinkID persistent identifier")
@@ -125,12 +161,12 @@ class LinkData(BaseModel):
     ref_date: str | None = Field(None, alias="refDate", description="ISO 8601 timestamp of referencing")
     hash: HashValue | None = Field(None, description="Content hash at refDate")
     alt_uris: list[str] = Field(default_factory=list, alias="altUris", description="Fallback URIs, ordered by preference")
-    status: str | None = Field(None, description="active | archived | broken | unknown")
+    status: Literal["active", "archived", "broken", "unknown"] | None = None
     last_checked: str | None = Field(None, alias="lastChecked", description="Last availability check (ISO 8601)")
     status_uri: str | None = Field(None, alias="statusUri", description="URI for live status query (opt-in only)")
 
 
-class FormulaData(BaseModel):
+class FormulaData(_SDLBase):
     """Data stream schema for /DataType /Formula (§4.3)."""
     latex: str | None = Field(None, description="LaTeX representation")
     mathml: str | None = Field(None, description="MathML representation (W3C standard)")
@@ -139,7 +175,7 @@ class FormulaData(BaseModel):
     context: str | None = Field(None, description="What the formula represents")
 
 
-class CodeData(BaseModel):
+class CodeData(_SDLBase):
     """Data stream schema for /DataType /Code (§4.4)."""
     language: str = Field(..., description="Programming language identifier")
     language_version: str | None = Field(None, alias="languageVersion")
@@ -150,10 +186,8 @@ class CodeData(BaseModel):
     repository: str | None = Field(None, description="Source repository URI")
 
 
-class TimelineEvent(BaseModel):
+class TimelineEvent(_SDLBase):
     """A single event or phase in a /DataType /Timeline stream."""
-    model_config = ConfigDict(populate_by_name=True)
-
     label: str
     date: str | None = None
     date_start: str | None = Field(None, alias="dateStart")
@@ -162,31 +196,31 @@ class TimelineEvent(BaseModel):
     critical: bool = False
 
 
-class TimelineData(BaseModel):
+class TimelineData(_SDLBase):
     """Data stream schema for /DataType /Timeline (§4.5)."""
     title: str | None = None
     events: list[TimelineEvent] = Field(default_factory=list)
     dependencies: list[dict[str, str]] = Field(default_factory=list)
 
 
-class IdentityData(BaseModel):
+class IdentityData(_SDLBase):
     """Data stream schema for /DataType /Identity (§4.6)."""
     name: str = Field(..., description="Full legal name of the party")
     role: str | None = None
     organization: str | None = None
     organization_id: str | None = Field(None, alias="organizationId")
     jurisdiction: str | None = Field(None, description="ISO 3166 code")
-    capacity: str | None = Field(None, description="authorized signatory | witness | notary | agent")
+    capacity: Literal["authorized signatory", "witness", "notary", "agent"] | None = None
     qualifications: list[str] = Field(default_factory=list)
     contact_email: str | None = Field(None, alias="contactEmail")
     signed_date: str | None = Field(None, alias="signedDate")
 
 
-class ClassificationData(BaseModel):
+class ClassificationData(_SDLBase):
     """Data stream schema for /DataType /Classification (§4.7)."""
-    confidentiality: str | None = Field(
-        None, description="public | internal | confidential | restricted | top-secret"
-    )
+    confidentiality: Literal[
+        "public", "internal", "confidential", "restricted", "top-secret"
+    ] | None = None
     retention_years: int | None = Field(None, alias="retentionYears")
     retention_basis: str | None = Field(None, alias="retentionBasis")
     regulatory_regime: list[str] = Field(default_factory=list, alias="regulatoryRegime")
@@ -197,14 +231,11 @@ class ClassificationData(BaseModel):
     declassification_date: str | None = Field(None, alias="declassificationDate")
 
 
-class ProvenanceData(BaseModel):
+class ProvenanceData(_SDLBase):
     """Data stream schema for /DataType /Provenance (§4.8). EU AI Act compliance support."""
-    model_config = ConfigDict(populate_by_name=True)
-
-    content_origin: str = Field(
-        ..., alias="contentOrigin",
-        description="human-authored | ai-generated | ai-assisted | translated | compiled",
-    )
+    content_origin: Literal[
+        "human-authored", "ai-generated", "ai-assisted", "translated", "compiled"
+    ] = Field(..., alias="contentOrigin")
     model: str | None = None
     model_provider: str | None = Field(None, alias="modelProvider")
     model_version: str | None = Field(None, alias="modelVersion")
@@ -218,16 +249,14 @@ class ProvenanceData(BaseModel):
     watermark: str | None = None
 
 
-class TranslationData(BaseModel):
+class TranslationData(_SDLBase):
     """Data stream schema for /DataType /Translation (§4.9)."""
-    model_config = ConfigDict(populate_by_name=True)
-
     original_language: str = Field(..., alias="originalLanguage", description="BCP 47")
     translated_language: str = Field(..., alias="translatedLanguage", description="BCP 47")
-    translation_method: str = Field(
-        ..., alias="translationMethod",
-        description="human-professional | human-non-professional | machine | machine-post-edited | ai-assisted",
-    )
+    translation_method: Literal[
+        "human-professional", "human-non-professional", "machine",
+        "machine-post-edited", "ai-assisted",
+    ] = Field(..., alias="translationMethod")
     translator: str | None = None
     certification_standard: str | None = Field(None, alias="certificationStandard")
     translation_date: str | None = Field(None, alias="translationDate")
@@ -236,7 +265,7 @@ class TranslationData(BaseModel):
     disclaimer: str | None = None
 
 
-class MeasurementEntry(BaseModel):
+class MeasurementEntry(_SDLBase):
     """A single measurement within /DataType /Measurement."""
     label: str
     value: float
@@ -247,7 +276,7 @@ class MeasurementEntry(BaseModel):
     standard: str | None = None
 
 
-class MeasurementData(BaseModel):
+class MeasurementData(_SDLBase):
     """Data stream schema for /DataType /Measurement (§4.10)."""
     measurements: list[MeasurementEntry] = Field(default_factory=list)
     material: str | None = None
@@ -260,10 +289,8 @@ class MeasurementData(BaseModel):
 # Sub-models – additional DataTypes
 # ---------------------------------------------------------------------------
 
-class ProcessStep(BaseModel):
+class ProcessStep(_SDLBase):
     """A single step or node in a /DataType /Process stream."""
-    model_config = ConfigDict(populate_by_name=True)
-
     id: str = Field(..., description="Unique step identifier")
     type: str = Field(..., description="startEvent | endEvent | task | gateway | subprocess | annotation")
     label: str = Field(..., description="Human-readable step name")
@@ -273,7 +300,7 @@ class ProcessStep(BaseModel):
     references: list[str] = Field(default_factory=list, description="Regulatory or policy references")
 
 
-class ProcessData(BaseModel):
+class ProcessData(_SDLBase):
     """
     Data stream schema for /DataType /Process.
     Captures BPMN 2.0 workflows, SOPs, clinical pathways, and other
@@ -281,8 +308,6 @@ class ProcessData(BaseModel):
     Applicable standards: ISO 9001, BPMN 2.0, FDA 21 CFR Part 11,
     ICH Q10, HL7 FHIR Workflow, TOGAF.
     """
-    model_config = ConfigDict(populate_by_name=True)
-
     notation: str | None = Field(None, description="BPMN 2.0 | UML Activity | Flowchart | SIPOC | VSM")
     title: str | None = Field(None, description="Process name")
     version: str | None = Field(None, description="Process version")
@@ -300,10 +325,8 @@ class ProcessData(BaseModel):
     kpis: list[dict[str, Any]] = Field(default_factory=list, description="Process KPIs")
 
 
-class RiskEntry(BaseModel):
+class RiskEntry(_SDLBase):
     """A single risk in a /DataType /Risk stream."""
-    model_config = ConfigDict(populate_by_name=True)
-
     id: str = Field(..., description="Risk identifier (e.g. R-001)")
     category: str = Field(..., description="Strategic | Operational | Financial | Compliance | Reputational")
     description: str = Field(..., description="Risk description")
@@ -317,15 +340,13 @@ class RiskEntry(BaseModel):
     review_date: str | None = Field(None, alias="reviewDate", description="ISO 8601")
 
 
-class RiskData(BaseModel):
+class RiskData(_SDLBase):
     """
     Data stream schema for /DataType /Risk.
     Captures risk registers and assessments embedded in PDF documents.
     Applicable standards: ISO 31000:2018, COSO ERM, Basel III/IV,
     Solvency II, NIST SP 800-30, ICH Q9.
     """
-    model_config = ConfigDict(populate_by_name=True)
-
     framework: str | None = Field(
         None, description="ISO 31000:2018 | COSO ERM | Basel III | Solvency II | NIST SP 800-30"
     )
@@ -342,7 +363,7 @@ class RiskData(BaseModel):
     approved_by: str | None = Field(None, alias="approvedBy")
 
 
-class StatisticsGroup(BaseModel):
+class StatisticsGroup(_SDLBase):
     """A single group or cohort in a /DataType /Statistics stream."""
     name: str
     n: int | None = Field(None, description="Sample size")
@@ -355,7 +376,7 @@ class StatisticsGroup(BaseModel):
     ci_upper: float | None = Field(None, alias="ciUpper", description="Confidence interval upper bound")
 
 
-class StatisticsData(BaseModel):
+class StatisticsData(_SDLBase):
     """
     Data stream schema for /DataType /Statistics.
     Captures statistical analyses, clinical trial results, and quantitative
@@ -363,8 +384,6 @@ class StatisticsData(BaseModel):
     Applicable standards: CDISC (SDTM, ADaM, DEFINE-XML), APA 7th edition,
     OSF pre-registration, CONSORT, PRISMA, STROBE.
     """
-    model_config = ConfigDict(populate_by_name=True)
-
     analysis: str | None = Field(None, description="Statistical test or analysis type")
     software: str | None = Field(None, description="Statistical software (e.g. R 4.3, SAS 9.4, SPSS 29)")
     preregistered: bool | None = Field(None, description="Whether analysis was pre-registered")
@@ -382,7 +401,7 @@ class StatisticsData(BaseModel):
     )
 
 
-class FindingData(BaseModel):
+class FindingData(_SDLBase):
     """
     Data stream schema for /DataType /Finding.
     Captures audit and inspection findings, non-conformances, and
@@ -390,8 +409,6 @@ class FindingData(BaseModel):
     Applicable standards: GAAS, PCAOB AS 2201, ISAE 3000, ISO 19011,
     ICH E6(R2) GCP, FDA 21 CFR Part 820, SOC 2.
     """
-    model_config = ConfigDict(populate_by_name=True)
-
     id: str | None = Field(None, description="Finding identifier (e.g. F-2025-001)")
     type: str | None = Field(
         None, description="critical | major | minor | observation | opportunity"
@@ -413,7 +430,7 @@ class FindingData(BaseModel):
     audit_id: str | None = Field(None, alias="auditId", description="Parent audit or inspection ID")
 
 
-class LicenseData(BaseModel):
+class LicenseData(_SDLBase):
     """
     Data stream schema for /DataType /License.
     Captures rights management, software licensing, and data licensing
@@ -421,8 +438,6 @@ class LicenseData(BaseModel):
     Applicable standards: SPDX 2.3, Creative Commons, Open Data Commons,
     FRAND licensing, EUPL.
     """
-    model_config = ConfigDict(populate_by_name=True)
-
     spdx_id: str | None = Field(
         None, alias="spdxId", description="SPDX license identifier (e.g. Apache-2.0, CC-BY-4.0)"
     )
@@ -453,7 +468,7 @@ class LicenseData(BaseModel):
     )
 
 
-class ObligationData(BaseModel):
+class ObligationData(_SDLBase):
     """
     Data stream schema for /DataType /Obligation.
     Captures contractual obligations, covenants, and legal commitments
@@ -462,8 +477,6 @@ class ObligationData(BaseModel):
     LKIF (Legal Knowledge Interchange Format), LegalRuleML,
     Swiss Code of Obligations, UNIDROIT PICC.
     """
-    model_config = ConfigDict(populate_by_name=True)
-
     id: str | None = Field(None, description="Obligation identifier (e.g. OBL-001)")
     type: str | None = Field(
         None,
@@ -486,7 +499,7 @@ class ObligationData(BaseModel):
     )
 
 
-class MaterialData(BaseModel):
+class MaterialData(_SDLBase):
     """
     Data stream schema for /DataType /Material.
     Captures chemical substance data, material specifications, and
@@ -495,8 +508,6 @@ class MaterialData(BaseModel):
     REACH (EC 1907/2006), Ph. Eur. (European Pharmacopoeia), USP,
     CAS Registry, ISO 10993, ASTM.
     """
-    model_config = ConfigDict(populate_by_name=True)
-
     name: str | None = Field(None, description="Substance or material name")
     iupac_name: str | None = Field(None, alias="iupacName", description="IUPAC systematic name")
     cas_number: str | None = Field(None, alias="casNumber", description="CAS Registry Number")
@@ -531,10 +542,165 @@ class MaterialData(BaseModel):
     sds_url: str | None = Field(None, alias="sdsUrl", description="Safety Data Sheet URL")
 
 
+# DataType -> data stream schema, for DataDef.typed_data(). Types without
+# an entry (Table, Record, Custom, ...) have free-form data streams.
+_DATA_MODELS: dict[DataType, type[_SDLBase]] = {
+    DataType.LINK: LinkData,
+    DataType.FORMULA: FormulaData,
+    DataType.CODE: CodeData,
+    DataType.TIMELINE: TimelineData,
+    DataType.IDENTITY: IdentityData,
+    DataType.CLASSIFICATION: ClassificationData,
+    DataType.PROVENANCE: ProvenanceData,
+    DataType.TRANSLATION: TranslationData,
+    DataType.MEASUREMENT: MeasurementData,
+    DataType.PROCESS: ProcessData,
+    DataType.RISK: RiskData,
+    DataType.STATISTICS: StatisticsData,
+    DataType.FINDING: FindingData,
+    DataType.LICENSE: LicenseData,
+    DataType.OBLIGATION: ObligationData,
+    DataType.MATERIAL: MaterialData,
+}
+
+
 # ---------------------------------------------------------------------------
 # Core DataDef Model
 # ---------------------------------------------------------------------------
 
+# DataTypes whose payload is only interpretable through an explicit schema.
+_SCHEMA_REQUIRED_TYPES = frozenset({DataType.CUSTOM})
+
+# Enum member -> value; a dict lookup is several times cheaper than .value
+_VALUE: dict[Enum, str] = {
+    m: m.value for m in (*DataType, *DataFormat, *TrustLevel, *ConformanceLevel)
+}
+
+# Enum member -> PDF name string ("/Table", "/JSON", "/Author", ...)
+_SLASH: dict[Enum, str] = {
+    m: f"/{m.value}" for m in (*DataType, *DataFormat, *TrustLevel)
+}
+
+
+def _require_cbor2() -> Any:
+    """Return the cbor2 module or raise a helpful ImportError."""
+    if cbor2 is None:
+        raise ImportError(
+            "CBOR data streams require the cbor2 package: pip install 'pdf-sdl[cbor]'"
+        )
+    return cbor2
+
+
+# Shared stdlib fallbacks for when orjson is absent or refuses a value; the
+# separators match orjson's compact and OPT_INDENT_2 output.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+_PRETTY_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, indent=2)
+# Writes NaN/Infinity as literals; only used to re-read them as null below.
+_NAN_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _encode_json(encoder: json.JSONEncoder, obj: Any) -> str:
+    """
+    Encode *obj* with a stdlib *encoder* created with ``allow_nan=False``.
+
+    NaN and Infinity are written as ``null``, which is what orjson does, so
+    the data stream is the same with or without the [fast] extra.
+    """
+    try:
+        return encoder.encode(obj)
+    except ValueError:
+        pass  # non-finite float; a circular reference raises again below
+    text = _NAN_ENCODER.encode(obj)
+    return encoder.encode(json.loads(text, parse_constant=lambda _: None))
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize *obj* to compact JSON text, with orjson when available."""
+    if orjson is not None:
+        try:
+            encoded: bytes = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which json writes as-is
+        else:
+            return encoded.decode("utf-8")
+    return _encode_json(_JSON_ENCODER, obj)
+
+
+def _loads_json(raw: str | bytes) -> Any:
+    """Parse JSON text or bytes, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which json accepts
+    return json.loads(raw)
+
+
+# One reusable pysimdjson parser per thread; a Parser is not thread-safe.
+_SIMDJSON_LOCAL = threading.local()
+
+
+def _simdjson_parser() -> Any:
+    """Return this thread's pysimdjson Parser, creating it on first use."""
+    assert simdjson is not None  # callers check for the [fast] extra
+    parser = getattr(_SIMDJSON_LOCAL, "parser", None)
+    if parser is None:
+        parser = _SIMDJSON_LOCAL.parser = simdjson.Parser()
+    return parser
+
+
+def _resolve_pointer(obj: Any, pointer: str) -> Any:
+    """Resolve a JSON Pointer (RFC 6901) against parsed JSON; KeyError if absent."""
+    if not pointer:
+        return obj
+    if pointer[0] != "/":
+        raise KeyError(pointer)
+    for token in pointer[1:].split("/"):
+        token = token.replace("~1", "/").replace("~0", "~")
+        try:
+            obj = obj[int(token)] if isinstance(obj, list) else obj[token]
+        except (LookupError, TypeError, ValueError):
+            raise KeyError(pointer) from None
+    return obj
+
+
+# Schema URIs repeat across a whole corpus and are often longer than the
+# default interning cutoff.
+_SCHEMA_URI_MAX = 2048
+
+def _intern(value: Any, max_len: int = 64) -> Any:
+    """Intern short identifier-like strings so repeated values share one object."""
+    if isinstance(value, str) and len(value) < max_len:
+        return sys.intern(value)
+    return value
+
+
+def _pdf_date(c: datetime) -> str:
+    """Format *c* as a PDF date string (``D:YYYYMMDDHHmmSS+00'00'``)."""
+    # Plain integer formatting; measurably faster than strftime for a fixed layout.
+    return (
+        f"D:{c.year:04d}{c.month:02d}{c.day:02d}"
+        f"{c.hour:02d}{c.minute:02d}{c.second:02d}+00'00'"
+    )
+
+
+def _compute_conformance(
+    trust_level: TrustLevel | None,
+    schema_uri: str | None,
+    source: str | None,
+    created: datetime | None,
+    generator: str | None,
+) -> ConformanceLevel:
+    """Conformance ladder (§8.1), shared by DataDef and DataDefBuilder."""
+    if schema_uri is None:
+        return ConformanceLevel.BASIC
+    if source is None or created is None or generator is None:
+        return ConformanceLevel.SCHEMA
+    if trust_level is TrustLevel.SIGNED:
+        return ConformanceLevel.SIGNED
+    return ConformanceLevel.PROVENANCE
+
+
 class DataDef(BaseModel):
     """
     DataDef Dictionary (§3.2).
@@ -544,14 +710,22 @@ class DataDef(BaseModel):
 
     Required keys: type, version, data_type, format, data.
     """
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(
+        populate_by_name=True, ser_json_bytes="base64", val_json_bytes="base64"
+    )
+
+    # Derived values cached per instance. Slots are not copied by
+    # model_copy() and are dropped whenever a field is reassigned.
+    __slots__ = ("_binding", "_conformance", "_pdf_dict", "_repr")
 
     # --- Required entries ---
     type: str = Field("DataDef", description="Must be /DataDef")
     version: int = Field(1, ge=1, description="Specification version")
     data_type: DataType = Field(..., description="Classification of the data (§4)")
     format: DataFormat = Field(..., description="Serialization format of the data stream")
-    data: str | dict[str, Any] = Field(..., description="The structured data content (inline or reference)")
+    data: str | bytes = Field(
+        ..., description="The structured data content (inline or reference; bytes for CBOR)"
+    )
 
     # --- Identification / provenance ---
     encoding: str = Field("UTF-8", description="Character encoding. Default: UTF-8")
@@ -578,67 +752,191 @@ class DataDef(BaseModel):
     object_id: str | None = Field(None, description="PDF object ID once written (e.g. '50 0 R')")
 
     @model_validator(mode="after")
-    def validate_enriched_requires_confidence(self) -> "DataDef":
+    def validate_invariants(self) -> "DataDef":
+        # One validator for all cross-field rules: one Python callback per model.
         if self.trust_level == TrustLevel.ENRICHED and self.confidence is None:
             raise ValueError(
                 "confidence is required when trust_level is TrustLevel.ENRICHED (§6.1)"
             )
-        return self
-
-    @model_validator(mode="after")
-    def validate_custom_requires_schema(self) -> "DataDef":
-        if self.data_type == DataType.CUSTOM and self.schema_uri is None:
+        if self.data_type in _SCHEMA_REQUIRED_TYPES and self.schema_uri is None:
             raise ValueError(
                 "schema_uri is required when data_type is DataType.CUSTOM (§4.11)"
             )
         return self
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._drop_caches()
+
+    def _drop_caches(self) -> None:
+        for slot in DataDef.__slots__:
+            with suppress(AttributeError):
+                object.__delattr__(self, slot)
+
     @field_validator("data", mode="before")
     @classmethod
-    def coerce_data(cls, v: Any) -> Any:
-        """Accept dict, str, or JSON-serializable objects."""
+    def coerce_data(cls, v: Any, info: ValidationInfo) -> Any:
+        """Accept dict or list payloads by serializing them to JSON text."""
         if isinstance(v, (dict, list)):
-            return json.dumps(v, ensure_ascii=False)
+            return _dumps_json(v)
+        if (
+            info.mode == "json"
+            and isinstance(v, str)
+            and info.data.get("format") is DataFormat.CBOR
+        ):
+            # CBOR payloads are base64 in the JSON form of the model
+            return base64.b64decode(v)
         return v
 
     def data_as_dict(self) -> Any:
-        """Parse and return the data stream as a Python object."""
-        if isinstance(self.data, str):
-            return json.loads(self.data)
-        return self.data
+        """
+        Parse and return the data stream as a Python object.
+
+        Each call returns a new object, so callers may modify the result.
+        """
+        if self.format is DataFormat.CBOR and isinstance(self.data, bytes):
+            return _require_cbor2().loads(self.data)
+        return _loads_json(self.data)
+
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "DataDef":
+        """
+        Create a DataDef from known-valid values without running validation.
+
+        Only the field names are checked: every key must be a field name
+        (not an alias) and all required fields must be present, otherwise
+        ``TypeError`` is raised. Values are not checked or coerced: *data*
+        must already be ``str`` or ``bytes``, enum fields must be enum
+        members, and the caller must guarantee the model invariants
+        (confidence for Enriched trust, schema_uri for Custom data).
+        """
+        if cls is not DataDef:
+            return cls.model_construct(**fields)
+        names = fields.keys()
+        if not (names <= _DATADEF_DEFAULTS.keys() and names >= _DATADEF_REQUIRED):
+            unknown = sorted(names - _DATADEF_DEFAULTS.keys())
+            missing = sorted(_DATADEF_REQUIRED - names)
+            raise TypeError(
+                f"from_trusted() got unknown fields {unknown} / missing required {missing}"
+            )
+        # What model_construct() does, minus its per-field Python loop over
+        # aliases and defaults, which makes it slower than validating.
+        #
+        # Pydantic internals this relies on (the contract the pydantic<3 pin
+        # in pyproject.toml protects): a v2 model instance is fully described
+        # by __dict__, __pydantic_fields_set__, __pydantic_extra__ and
+        # __pydantic_private__. test_from_trusted_matches_model_construct
+        # fails if a release changes that.
+        datadef = cls.__new__(cls)
+        object.__setattr__(datadef, "__dict__", {**_DATADEF_DEFAULTS, **fields})
+        object.__setattr__(datadef, "__pydantic_fields_set__", set(fields))
+        object.__setattr__(datadef, "__pydantic_extra__", None)
+        object.__setattr__(datadef, "__pydantic_private__", None)
+        return datadef
+
+    def data_field(self, pointer: str) -> Any:
+        """
+        Return one value from the data stream by JSON Pointer (RFC 6901).
+
+        ``data_field("/rows/0/label")`` is equivalent to indexing
+        :meth:`data_as_dict`, but when pysimdjson is installed only the
+        addressed value is materialized. Raises ``KeyError`` if the pointer
+        does not resolve.
+        """
+        if simdjson is not None and self.format is DataFormat.JSON:
+            raw = self.data.encode("utf-8") if isinstance(self.data, str) else self.data
+            try:
+                value = _simdjson_parser().parse(raw).at_pointer(pointer)
+            except (LookupError, TypeError):
+                raise KeyError(pointer) from None
+            except ValueError:
+                pass  # not strict JSON (e.g. NaN); take the full parse below
+            else:
+                if isinstance(value, simdjson.Object):
+                    return value.as_dict()
+                if isinstance(value, simdjson.Array):
+                    return value.as_list()
+                return value
+        return _resolve_pointer(self.data_as_dict(), pointer)
+
+    def typed_data(self) -> Any:
+        """
+        Return the data stream validated against its DataType schema.
+
+        For DataTypes with a schema model (e.g. ``LinkData`` for
+        ``DataType.LINK``) this is a model instance; for free-form types it
+        is the :meth:`data_as_dict` result. Raises ``ValidationError`` if
+        the stream does not match the schema.
+        """
+        model = _DATA_MODELS.get(self.data_type)
+        if model is None:
+            return self.data_as_dict()
+        if self.format is DataFormat.JSON:
+            # pydantic-core parses straight into the model, no dict in between
+            return model.model_validate_json(self.data)
+        return model.model_validate(self.data_as_dict())
+
+    @classmethod
+    def from_payload(cls, payload: Any, **kwargs: Any) -> "DataDef":
+        """
+        Create a DataDef from an already-parsed JSON payload.
+
+        The payload is serialized once, with orjson when it is available.
+        """
+        return cls(data=_dumps_json(payload), **kwargs)
 
     def has_binding(self) -> bool:
         """Returns True if at least one binding mechanism is present (§5)."""
-        return any([self.struct_ref, self.annot_ref, self.page_ref is not None])
+        try:
+            return self._binding
+        except AttributeError:
+            pass
+        self._binding: bool = bool(
+            self.struct_ref or self.annot_ref or self.page_ref is not None
+        )
+        return self._binding
 
     def conformance_level(self) -> ConformanceLevel:
         """Determine the highest conformance level satisfied by this DataDef (§8.1)."""
-        if (
-            self.trust_level == TrustLevel.SIGNED
-            and self.schema_uri is not None
-            and self.source is not None
-            and self.created is not None
-            and self.generator is not None
-        ):
-            return ConformanceLevel.SIGNED
-        if (
-            self.schema_uri is not None
-            and self.source is not None
-            and self.created is not None
-            and self.generator is not None
-        ):
-            return ConformanceLevel.PROVENANCE
-        if self.schema_uri is not None:
-            return ConformanceLevel.SCHEMA
-        return ConformanceLevel.BASIC
+        try:
+            return self._conformance
+        except AttributeError:
+            pass
+        # Cached until a field is reassigned (see __setattr__).
+        self._conformance: ConformanceLevel = _compute_conformance(
+            self.trust_level, self.schema_uri, self.source, self.created, self.generator
+        )
+        return self._conformance
+
+    @property
+    def pdf_dict(self) -> MappingProxyType[str, Any]:
+        """
+        Read-only view of the PDF dictionary entries.
+
+        Built on first access and reused until a field is reassigned, so
+        re-emitting an unchanged DataDef does not rebuild it.
+        """
+        try:
+            return self._pdf_dict
+        except AttributeError:
+            pass
+        self._pdf_dict: MappingProxyType[str, Any] = MappingProxyType(self._build_pdf_dict())
+        return self._pdf_dict
 
     def to_pdf_dict(self) -> dict[str, Any]:
         """Serialize to a flat dict suitable for PDF dictionary entries."""
+        d = dict(self.pdf_dict)
+        if "Rect" in d:
+            d["Rect"] = list(d["Rect"])  # cached as a tuple so the view stays immutable
+        return d
+
+    def _build_pdf_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {
             "Type": "DataDef",
             "Version": self.version,
-            "DataType": f"/{self.data_type.value}",
-            "Format": f"/{self.format.value}",
+            "DataType": _SLASH[self.data_type],
+            "Format": _SLASH[self.format],
         }
         if self.encoding != "UTF-8":
             d["Encoding"] = f"/{self.encoding}"
@@ -649,11 +947,11 @@ class DataDef(BaseModel):
         if self.source:
             d["Source"] = self.source
         if self.created:
-            d["Created"] = self.created.strftime("D:%Y%m%d%H%M%S+00'00'")
+            d["Created"] = _pdf_date(self.created)
         if self.generator:
             d["Generator"] = self.generator
         if self.trust_level:
-            d["TrustLevel"] = f"/{self.trust_level.value}"
+            d["TrustLevel"] = _SLASH[self.trust_level]
         if self.confidence is not None:
             d["Confidence"] = self.confidence
         if self.struct_ref:
@@ -663,13 +961,29 @@ class DataDef(BaseModel):
         if self.page_ref is not None:
             d["PageRef"] = self.page_ref
         if self.rect:
-            d["Rect"] = list(self.rect)
+            d["Rect"] = tuple(self.rect)
         if self.status_uri:
             d["StatusURI"] = self.status_uri
         return d
 
     def __repr__(self) -> str:
-        return (
-            f"DataDef(type={self.data_type.value!r}, format={self.format.value!r}, "
-            f"trust={self.trust_level}, conformance={self.conformance_level().value!r})"
+        try:
+            return self._repr
+        except AttributeError:
+            pass
+        self._repr: str = (
+            f"DataDef(type={_VALUE[self.data_type]!r}, format={_VALUE[self.format]!r}, "
+            f"trust={self.trust_level}, conformance={_VALUE[self.conformance_level()]!r})"
         )
+        return self._repr
+
+
+# Field name -> default, in declaration order, for DataDef.from_trusted().
+# Required fields map to None and are expected in the caller's values.
+_DATADEF_DEFAULTS: dict[str, Any] = {
+    name: None if info.is_required() else info.default
+    for name, info in DataDef.model_fields.items()
+}
+_DATADEF_REQUIRED = frozenset(
+    name for name, info in DataDef.model_fields.items() if info.is_required()
+)
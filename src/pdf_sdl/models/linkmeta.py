@@ -14,6 +14,7 @@ Issue #725 – Lack of Internet-Aware Content Representation in PDF.
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -34,6 +35,10 @@ class HashAlgorithm(str, Enum):
     SHA512 = "SHA-512"
 
 
+# Enum member -> PDF name string ("/Active", "/SHA-256", ...)
+_SLASH: dict[Enum, str] = {m: f"/{m.value}" for m in (*LinkStatus, *HashAlgorithm)}
+
+
 class ContentHash(BaseModel):
     """
     Content hash of the target resource at /RefDate (§3.2 Integrity).
@@ -48,7 +53,13 @@ class ContentHash(BaseModel):
     value: str = Field(..., description="Hex-encoded hash value")
 
     def to_pdf_dict(self) -> dict[str, str]:
-        return {"Algorithm": f"/{self.algorithm.value}", "Value": self.value}
+        return {"Algorithm": _SLASH[self.algorithm], "Value": self.value}
+
+
+@lru_cache(maxsize=4096)
+def _make_hash(algorithm: HashAlgorithm, value: str) -> ContentHash:
+    """Shared ContentHash per (algorithm, value); ContentHash is frozen."""
+    return ContentHash(algorithm=algorithm, value=value)
 
 
 class LinkMeta(BaseModel):
@@ -210,7 +221,7 @@ class LinkMeta(BaseModel):
         if self.alt_uris:
             d["AltURIs"] = self.alt_uris
         if self.status:
-            d["Status"] = f"/{self.status.value}"
+            d["Status"] = _SLASH[self.status]
         if self.last_checked:
             d["LastChecked"] = self.last_checked
         if self.status_uri:
@@ -23,14 +23,31 @@ Example::
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import pikepdf
 
-from ..models.datadef import DataDef, DataFormat, DataType, TrustLevel
-from ..models.linkmeta import ContentHash, HashAlgorithm, LinkMeta, LinkStatus
+from ..models.datadef import (
+    DataDef,
+    DataFormat,
+    DataType,
+    TrustLevel,
+    _SCHEMA_URI_MAX,
+    _VALUE,
+    _intern,
+)
+from ..models.linkmeta import HashAlgorithm, LinkMeta, LinkStatus, _make_hash
+
+# PDF name value -> enum member. A dict lookup is ~10x cheaper than
+# calling the Enum class and catching ValueError for unknown names.
+_DATA_TYPES = {m.value: m for m in DataType}
+_FORMATS = {m.value: m for m in DataFormat}
+_TRUST_LEVELS = {m.value: m for m in TrustLevel}
+_LINK_STATUSES = {m.value: m for m in LinkStatus}
+_HASH_ALGORITHMS = {m.value: m for m in HashAlgorithm}
 
 
 class SDLReader:
@@ -44,9 +61,19 @@ class SDLReader:
     4. (Optional) full scan for any /Type /DataDef object
     """
 
-    def __init__(self, source: str | Path) -> None:
-        self._path = Path(source)
-        self._pdf = pikepdf.open(str(source))
+    def __init__(self, source: str | Path | BinaryIO) -> None:
+        """
+        Parameters
+        ----------
+        source:
+            Path to a PDF, or a readable binary file-like object (e.g. io.BytesIO).
+        """
+        if isinstance(source, (str, Path)):
+            self._path: Path | None = Path(source)
+            self._pdf = pikepdf.open(str(source))
+        else:
+            self._path = None
+            self._pdf = pikepdf.open(source)
 
     def __enter__(self) -> "SDLReader":
         return self
@@ -68,8 +95,17 @@ class SDLReader:
             If True, scan all indirect objects in the file (slower but complete).
             Default: use catalog + page arrays only.
         """
+        return list(self.iter_datadefs(full_scan=full_scan))
+
+    def iter_datadefs(self, *, full_scan: bool = False) -> Iterator[DataDef]:
+        """
+        Yield DataDef objects one at a time as they are discovered.
+
+        Same discovery order as :meth:`find_datadefs`, but callers can
+        process each DataDef while the rest of the document is still being
+        parsed, without holding the whole list in memory.
+        """
         refs: set[int] = set()
-        datadefs: list[DataDef] = []
 
         # 1. Catalog discovery
         catalog = self._pdf.Root
@@ -80,7 +116,7 @@ class SDLReader:
                     refs.add(obj_id)
                     dd = self._parse_datadef(ref)
                     if dd:
-                        datadefs.append(dd)
+                        yield dd
 
         # 2. Page-level discovery
         for page in self._pdf.pages:
@@ -91,7 +127,7 @@ class SDLReader:
                         refs.add(obj_id)
                         dd = self._parse_datadef(ref)
                         if dd:
-                            datadefs.append(dd)
+                            yield dd
 
         # 3. Full scan (optional)
         if full_scan:
@@ -104,18 +140,21 @@ class SDLReader:
                     ):
                         refs.add(self._obj_id(obj))
                         dd = self._parse_datadef(obj)
-                        if dd:
-                            datadefs.append(dd)
+                    else:
+                        continue
                 except Exception:
                     continue
-
-        return datadefs
+                if dd:
+                    yield dd
 
     def find_linkmetas(self) -> list[LinkMeta]:
         """
         Find all LinkMeta dictionaries by scanning annotations on all pages.
         """
-        linkmetas: list[LinkMeta] = []
+        return list(self.iter_linkmetas())
+
+    def iter_linkmetas(self) -> Iterator[LinkMeta]:
+        """Yield LinkMeta objects one at a time, page by page."""
         for page_num, page in enumerate(self._pdf.pages, start=1):
             if "/Annots" not in page:
                 continue
@@ -124,16 +163,16 @@ class SDLReader:
                     annot_obj = annot
                     if hasattr(annot, "obj"):
                         annot_obj = annot.obj
-                    if "/LinkMeta" in annot_obj:
-                        lm = self._parse_linkmeta(
-                            annot_obj["/LinkMeta"],
-                            annot_ref=f"page {page_num} annot {annot_idx}",
-                        )
-                        if lm:
-                            linkmetas.append(lm)
+                    if "/LinkMeta" not in annot_obj:
+                        continue
+                    lm = self._parse_linkmeta(
+                        annot_obj["/LinkMeta"],
+                        annot_ref=f"page {page_num} annot {annot_idx}",
+                    )
                 except Exception:
                     continue
-        return linkmetas
+                if lm:
+                    yield lm
 
     def get_datadef_count(self) -> int:
         """Returns the number of DataDef objects discoverable via catalog."""
@@ -148,14 +187,14 @@ class SDLReader:
         linkmetas = self.find_linkmetas()
         type_counts: dict[str, int] = {}
         for dd in datadefs:
-            k = dd.data_type.value
+            k = _VALUE[dd.data_type]
             type_counts[k] = type_counts.get(k, 0) + 1
         return {
-            "source": str(self._path),
+            "source": str(self._path) if self._path is not None else "<stream>",
             "datadef_count": len(datadefs),
             "linkmeta_count": len(linkmetas),
             "datatype_breakdown": type_counts,
-            "conformance_levels": [dd.conformance_level().value for dd in datadefs],
+            "conformance_levels": [_VALUE[dd.conformance_level()] for dd in datadefs],
         }
 
     # ------------------------------------------------------------------
@@ -177,25 +216,21 @@ class SDLReader:
             data_type_name = str(obj.get("/DataType", "/Custom")).lstrip("/")
             format_name = str(obj.get("/Format", "/JSON")).lstrip("/")
 
-            try:
-                data_type = DataType(data_type_name)
-            except ValueError:
-                data_type = DataType.CUSTOM
+            data_type = _DATA_TYPES.get(data_type_name, DataType.CUSTOM)
+            fmt = _FORMATS.get(format_name, DataFormat.JSON)
 
-            try:
-                fmt = DataFormat(format_name)
-            except ValueError:
-                fmt = DataFormat.JSON
-
-            # Read data stream
-            data_str = ""
+            # Read data stream (CBOR stays binary)
+            data_str: str | bytes = ""
             if "/Data" in obj:
                 data_obj = obj["/Data"]
                 if hasattr(data_obj, "obj"):
                     data_obj = data_obj.obj
                 if isinstance(data_obj, pikepdf.Stream):
                     raw = data_obj.read_bytes()
-                    data_str = raw.decode("utf-8", errors="replace")
+                    if fmt is DataFormat.CBOR:
+                        data_str = raw
+                    else:
+                        data_str = raw.decode("utf-8", errors="replace")
                 elif isinstance(data_obj, pikepdf.Dictionary):
                     data_str = "{}"
 
@@ -203,10 +238,7 @@ class SDLReader:
             trust_level = None
             tl_val = obj.get("/TrustLevel")
             if tl_val:
-                try:
-                    trust_level = TrustLevel(str(tl_val).lstrip("/"))
-                except ValueError:
-                    pass
+                trust_level = _TRUST_LEVELS.get(str(tl_val).lstrip("/"))
 
             confidence = None
             if "/Confidence" in obj:
@@ -233,8 +265,8 @@ class SDLReader:
                 data_type=data_type,
                 format=fmt,
                 data=data_str,
-                encoding=str(obj.get("/Encoding", "UTF-8")).lstrip("/"),
-                schema_uri=self._str_or_none(obj.get("/Schema")),
+                encoding=_intern(str(obj.get("/Encoding", "UTF-8")).lstrip("/")),
+                schema_uri=_intern(self._str_or_none(obj.get("/Schema")), _SCHEMA_URI_MAX),
                 schema_version=self._str_or_none(obj.get("/SchemaVersion")),
                 source=self._str_or_none(obj.get("/Source")),
                 created=created,
@@ -261,21 +293,15 @@ class SDLReader:
             status = None
             s_val = obj.get("/Status")
             if s_val:
-                try:
-                    status = LinkStatus(str(s_val).lstrip("/"))
-                except ValueError:
-                    pass
+                status = _LINK_STATUSES.get(str(s_val).lstrip("/"))
 
             hash_obj = None
             if "/Hash" in obj:
                 h = obj["/Hash"]
                 algo_str = str(h.get("/Algorithm", "/SHA-256")).lstrip("/")
-                try:
-                    algo = HashAlgorithm(algo_str)
-                except ValueError:
-                    algo = HashAlgorithm.SHA256
+                algo = _HASH_ALGORITHMS.get(algo_str, HashAlgorithm.SHA256)
                 hash_val = self._str_or_none(h.get("/Value")) or ""
-                hash_obj = ContentHash(algorithm=algo, value=hash_val)
+                hash_obj = _make_hash(algo, hash_val)
 
             alt_uris: list[str] = []
             if "/AltURIs" in obj:
@@ -326,7 +352,7 @@ class SDLReader:
         if val is None:
             return None
         s = str(val)
-        return s if s else None
+        return _intern(s) if s else None
 
     @staticmethod
     def _int_or_none(val: Any) -> int | None:
@@ -25,12 +25,13 @@ Example::
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import pikepdf
 
-from ..models.datadef import DataDef, DataType
+from ..models.datadef import _SLASH, DataDef, _pdf_date
 from ..models.linkmeta import LinkMeta
 
 
@@ -48,15 +49,18 @@ class SDLWriter:
 
     SDL_GENERATOR = "pdf-sdl v0.1.0 (https://github.com/Link-Genetic-Inc/pdf-sdl)"
 
-    def __init__(self, source: str | Path | None = None) -> None:
+    def __init__(self, source: str | Path | BinaryIO | None = None) -> None:
         """
         Parameters
         ----------
         source:
-            Path to an existing PDF to open, or None to create a new empty PDF.
+            Path or binary file-like object of an existing PDF to open,
+            or None to create a new empty PDF.
         """
-        if source is not None:
+        if isinstance(source, (str, Path)):
             self._pdf = pikepdf.open(str(source))
+        elif source is not None:
+            self._pdf = pikepdf.open(source)
         else:
             self._pdf = pikepdf.new()
             # Add a blank page so the document is valid
@@ -89,6 +93,7 @@ class SDLWriter:
         *,
         page: int | None = None,
         add_to_catalog: bool = True,
+        data_bytes: bytes | None = None,
     ) -> pikepdf.Object:
         """
         Write a DataDef dictionary (plus its data stream) into the PDF.
@@ -102,13 +107,60 @@ class SDLWriter:
             If None, only added to the catalog (unless add_to_catalog=False).
         add_to_catalog:
             Whether to register in the document catalog's /DataDefs array (§5.5).
+        data_bytes:
+            Already-encoded payload for the data stream. When given, the
+            DataDef's data is not serialized and encoded a second time.
 
         Returns
         -------
         The pikepdf indirect object reference for the written DataDef.
         """
+        dd_ref = self._write_datadef(datadef, data_bytes)
+
+        # Register in catalog
+        if add_to_catalog:
+            self._register_in_catalog(dd_ref)
+
+        # Register on page
+        if page is not None:
+            self._register_on_page(dd_ref, page)
+
+        return dd_ref
+
+    def add_datadefs(
+        self,
+        datadefs: Iterable[DataDef],
+        *,
+        page: int | None = None,
+        add_to_catalog: bool = True,
+    ) -> list[pikepdf.Object]:
+        """
+        Write many DataDefs in one pass.
+
+        Equivalent to calling :meth:`add_datadef` for each item, but the
+        catalog and page /DataDefs arrays are looked up once and extended
+        with all new references at the end.
+
+        Returns
+        -------
+        The indirect object references, in input order.
+        """
+        refs = [self._write_datadef(datadef, None) for datadef in datadefs]
+        if refs and add_to_catalog:
+            self._catalog_datadefs().extend(refs)
+        if refs and page is not None:
+            page_array = self._page_datadefs(page)
+            if page_array is not None:
+                page_array.extend(refs)
+        return refs
+
+    def _write_datadef(
+        self, datadef: DataDef, data_bytes: bytes | None
+    ) -> pikepdf.Object:
+        """Write the data stream and DataDef dictionary; return the indirect ref."""
         # Build the data stream
-        data_bytes = self._encode_data(datadef)
+        if data_bytes is None:
+            data_bytes = self._encode_data(datadef)
         stream_obj = pikepdf.Stream(self._pdf, data_bytes)
         stream_ref = self._pdf.make_indirect(stream_obj)
 
@@ -116,8 +168,8 @@ class SDLWriter:
         dd_dict = pikepdf.Dictionary(
             Type=pikepdf.Name("/DataDef"),
             Version=datadef.version,
-            DataType=pikepdf.Name(f"/{datadef.data_type.value}"),
-            Format=pikepdf.Name(f"/{datadef.format.value}"),
+            DataType=pikepdf.Name(_SLASH[datadef.data_type]),
+            Format=pikepdf.Name(_SLASH[datadef.format]),
             Data=stream_ref,
         )
 
@@ -130,11 +182,11 @@ class SDLWriter:
         if datadef.source:
             dd_dict["/Source"] = datadef.source
         if datadef.created:
-            dd_dict["/Created"] = datadef.created.strftime("D:%Y%m%d%H%M%S+00'00'")
+            dd_dict["/Created"] = _pdf_date(datadef.created)
         if datadef.generator:
             dd_dict["/Generator"] = datadef.generator
         if datadef.trust_level:
-            dd_dict["/TrustLevel"] = pikepdf.Name(f"/{datadef.trust_level.value}")
+            dd_dict["/TrustLevel"] = pikepdf.Name(_SLASH[datadef.trust_level])
         if datadef.confidence is not None:
             dd_dict["/Confidence"] = datadef.confidence
         if datadef.struct_ref:
@@ -150,15 +202,6 @@ class SDLWriter:
 
         dd_ref = self._pdf.make_indirect(dd_dict)
         self._written_datadefs.append(dd_ref)
-
-        # Register in catalog
-        if add_to_catalog:
-            self._register_in_catalog(dd_ref)
-
-        # Register on page
-        if page is not None:
-            self._register_on_page(dd_ref, page)
-
         return dd_ref
 
     def add_linkmeta(
@@ -234,7 +277,7 @@ class SDLWriter:
 
     def save(
         self,
-        output: str | Path,
+        output: str | Path | BinaryIO,
         *,
         incremental: bool = False,
         linearize: bool = False,
@@ -245,7 +288,7 @@ class SDLWriter:
         Parameters
         ----------
         output:
-            Output file path.
+            Output file path, or a writable binary file-like object (e.g. io.BytesIO).
         incremental:
             If True, use incremental save (preserves existing signatures). (§7.1)
         linearize:
@@ -255,10 +298,11 @@ class SDLWriter:
         if linearize:
             options["linearize"] = True
 
+        target = str(output) if isinstance(output, (str, Path)) else output
         if incremental:
-            self._pdf.save(str(output), incremental=True)
+            self._pdf.save(target, incremental=True)
         else:
-            self._pdf.save(str(output), **options)
+            self._pdf.save(target, **options)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -266,28 +310,40 @@ class SDLWriter:
 
     def _encode_data(self, datadef: DataDef) -> bytes:
         """Serialize the DataDef data to bytes for the PDF stream."""
+        if isinstance(datadef.data, bytes):
+            return datadef.data
         if isinstance(datadef.data, str):
             raw = datadef.data
         else:
-            raw = json.dumps(datadef.data, ensure_ascii=False, indent=2)
+            raw = json.dumps(datadef.data, ensure_ascii=False, separators=(",", ":"))
         return raw.encode(datadef.encoding or "utf-8")
 
-    def _register_in_catalog(self, dd_ref: pikepdf.Object) -> None:
-        """Add dd_ref to the document catalog's /DataDefs array (§5.5)."""
+    def _catalog_datadefs(self) -> pikepdf.Array:
+        """Return the catalog's /DataDefs array, creating it if needed."""
         catalog = self._pdf.Root
         if "/DataDefs" not in catalog:
             catalog["/DataDefs"] = pikepdf.Array()
-        catalog["/DataDefs"].append(dd_ref)
+        return catalog["/DataDefs"]
 
-    def _register_on_page(self, dd_ref: pikepdf.Object, page: int) -> None:
-        """Add dd_ref to the specified page's /DataDefs array (§5.5)."""
+    def _page_datadefs(self, page: int) -> pikepdf.Array | None:
+        """Return a page's /DataDefs array, creating it if needed (None if no such page)."""
         try:
             page_obj = self._pdf.pages[page - 1]
-            if "/DataDefs" not in page_obj:
-                page_obj["/DataDefs"] = pikepdf.Array()
-            page_obj["/DataDefs"].append(dd_ref)
         except IndexError:
-            pass
+            return None
+        if "/DataDefs" not in page_obj:
+            page_obj["/DataDefs"] = pikepdf.Array()
+        return page_obj["/DataDefs"]
+
+    def _register_in_catalog(self, dd_ref: pikepdf.Object) -> None:
+        """Add dd_ref to the document catalog's /DataDefs array (§5.5)."""
+        self._catalog_datadefs().append(dd_ref)
+
+    def _register_on_page(self, dd_ref: pikepdf.Object, page: int) -> None:
+        """Add dd_ref to the specified page's /DataDefs array (§5.5)."""
+        page_array = self._page_datadefs(page)
+        if page_array is not None:
+            page_array.append(dd_ref)
 
     @property
     def pdf(self) -> pikepdf.Pdf:
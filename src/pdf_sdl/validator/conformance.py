@@ -18,14 +18,28 @@ Example::
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from enum import Enum
+from types import ModuleType
 from typing import Any
-import json
 
-from ..models.datadef import DataDef, DataType, TrustLevel, ConformanceLevel
+from ..models.datadef import (
+    _SCHEMA_REQUIRED_TYPES,
+    _VALUE,
+    DataDef,
+    DataFormat,
+    DataType,
+    TrustLevel,
+)
 from ..models.linkmeta import LinkMeta
 
+cbor2: ModuleType | None
+try:
+    import cbor2
+except ImportError:  # optional, see the [cbor] extra
+    cbor2 = None
+
 
 # ---------------------------------------------------------------------------
 # Result types
@@ -95,8 +109,13 @@ class DataDefValidator:
     - DD-013  /Schema URI should use https://
     - DD-014  /Rect requires /PageRef
     - DD-015  /Confidence 0.0 on Signed is suspicious
+
+    Instances hold no per-call state; reuse one validator across calls.
     """
 
+    VALID_FORMATS = frozenset({"JSON", "XML", "CSV", "CBOR"})
+    VALID_DATA_TYPES = frozenset(m.value for m in DataType)
+
     def validate(self, datadef: DataDef) -> ValidationResult:
         issues: list[ValidationIssue] = []
         rules_run = 0
@@ -116,15 +135,12 @@ class DataDefValidator:
 
         # DD-003 DataType
         rules_run += 1
-        try:
-            DataType(datadef.data_type)
-        except ValueError:
+        if datadef.data_type not in self.VALID_DATA_TYPES:
             add("DD-003", Severity.ERROR, f"Unknown /DataType: {datadef.data_type}", "data_type")
 
         # DD-004 Format
         rules_run += 1
-        valid_formats = {"JSON", "XML", "CSV", "CBOR"}
-        if datadef.format.value not in valid_formats:
+        if datadef.format not in self.VALID_FORMATS:
             add("DD-004", Severity.ERROR, f"Unknown /Format: {datadef.format}", "format")
 
         # DD-005 Data present
@@ -178,7 +194,7 @@ class DataDefValidator:
 
         # DD-010 Custom requires schema
         rules_run += 1
-        if datadef.data_type == DataType.CUSTOM and not datadef.schema_uri:
+        if datadef.data_type in _SCHEMA_REQUIRED_TYPES and not datadef.schema_uri:
             add(
                 "DD-010",
                 Severity.ERROR,
@@ -188,8 +204,12 @@ class DataDefValidator:
 
         # DD-011 Data parseability
         rules_run += 1
-        if datadef.data and datadef.format.value == "JSON":
-            data_str = datadef.data if isinstance(datadef.data, str) else json.dumps(datadef.data)
+        if datadef.data and datadef.format is DataFormat.JSON:
+            data_str = (
+                datadef.data
+                if isinstance(datadef.data, (str, bytes))
+                else json.dumps(datadef.data)
+            )
             try:
                 json.loads(data_str)
             except json.JSONDecodeError as e:
@@ -199,6 +219,16 @@ class DataDefValidator:
                     f"/Data is not valid JSON: {e}",
                     "data",
                 )
+        elif isinstance(datadef.data, bytes) and datadef.format is DataFormat.CBOR and cbor2:
+            try:
+                cbor2.loads(datadef.data)
+            except cbor2.CBORDecodeError as e:
+                add(
+                    "DD-011",
+                    Severity.ERROR,
+                    f"/Data is not valid CBOR: {e}",
+                    "data",
+                )
 
         # DD-012 PageRef >= 1
         rules_run += 1
@@ -238,7 +268,7 @@ class DataDefValidator:
         passed = not any(i.severity == Severity.ERROR for i in issues)
         return ValidationResult(
             passed=passed,
-            conformance_level=datadef.conformance_level().value,
+            conformance_level=_VALUE[datadef.conformance_level()],
             issues=issues,
             rule_count=rules_run,
         )
@@ -270,6 +300,8 @@ class LinkMetaValidator:
     - LM-010  At least one dimension beyond minimal recommended
     """
 
+    VALID_HASH_ALGORITHMS = frozenset({"SHA-256", "SHA-384", "SHA-512"})
+
     KNOWN_ARCHIVE_DOMAINS = {
         "web.archive.org",
         "perma.cc",
@@ -316,8 +348,7 @@ class LinkMetaValidator:
         # LM-006 Hash algorithm
         rules_run += 1
         if linkmeta.hash:
-            valid_algos = {"SHA-256", "SHA-384", "SHA-512"}
-            if linkmeta.hash.algorithm.value not in valid_algos:
+            if linkmeta.hash.algorithm not in self.VALID_HASH_ALGORITHMS:
                 add("LM-006", Severity.ERROR, f"Unsupported /Hash/Algorithm: {linkmeta.hash.algorithm}", "hash")
 
         # LM-007 AltURIs quality
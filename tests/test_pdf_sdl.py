@@ -8,12 +8,16 @@ SDL Technical Specification v1.4.0 – 25 DataTypes.
 
 from __future__ import annotations
 
+import io
 import json
+import re
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
+from click.testing import CliRunner
+from pydantic import ValidationError
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -34,7 +38,11 @@ from pdf_sdl import (
     ConformanceLevel,
     ContentHash,
     HashAlgorithm,
+    HashValue,
+    LinkData,
+    ProvenanceData,
 )
+from pdf_sdl.cli.main import cli
 
 
 # ===========================================================================
@@ -177,6 +185,47 @@ class TestDataDefModel:
         )
         assert dd2.conformance_level() == ConformanceLevel.SIGNED
 
+    def test_data_as_dict_matches_stream(self) -> None:
+        payload = {1: "a", "rows": (1, 2)}
+        dd = DataDefBuilder.table().build(payload)
+        assert dd.data_as_dict() == {"1": "a", "rows": [1, 2]}
+        payload["rows"] = ()
+        assert dd.data_as_dict() == json.loads(dd.data)
+        dd.data = '{"rows": []}'
+        assert dd.data_as_dict() == {"rows": []}
+        dd.data_as_dict()["rows"].append(1)
+        assert dd.data_as_dict() == {"rows": []}
+
+    def test_from_payload(self) -> None:
+        payload = {"metric": "revenue", "value": 1}
+        dd = DataDef.from_payload(payload, data_type=DataType.VALUE, format=DataFormat.JSON)
+        assert json.loads(dd.data) == payload
+        assert dd.data_as_dict() == payload
+        parsed = DataDef(data_type=DataType.VALUE, format=DataFormat.JSON, data=payload)
+        assert parsed.data == dd.data
+
+    def test_from_payload_beyond_orjson(self) -> None:
+        payload = {"a": 2**70, "b": float("inf")}
+        dd = DataDef.from_payload(payload, data_type=DataType.VALUE, format=DataFormat.JSON)
+        assert dd.data_as_dict() == {"a": 2**70, "b": None}
+        parsed = DataDef(data_type=DataType.VALUE, format=DataFormat.JSON, data=payload)
+        assert parsed.data == dd.data
+
+    def test_data_as_dict_accepts_nan(self) -> None:
+        dd = DataDef(data_type=DataType.VALUE, format=DataFormat.JSON, data='{"v": NaN}')
+        assert dd.data_as_dict()["v"] != dd.data_as_dict()["v"]
+
+    def test_json_bytes_payload(self) -> None:
+        dd = DataDef(data_type=DataType.VALUE, format=DataFormat.JSON, data=b'{"v":1}')
+        assert dd.data_as_dict() == {"v": 1}
+
+    def test_conformance_follows_updates(self, full_table_datadef: DataDef) -> None:
+        assert full_table_datadef.conformance_level() == ConformanceLevel.PROVENANCE
+        copied = full_table_datadef.model_copy(update={"source": None})
+        assert copied.conformance_level() == ConformanceLevel.SCHEMA
+        full_table_datadef.schema_uri = None
+        assert full_table_datadef.conformance_level() == ConformanceLevel.BASIC
+
     def test_enriched_requires_confidence(self) -> None:
         with pytest.raises(Exception):
             DataDef(
@@ -204,12 +253,109 @@ class TestDataDefModel:
         assert "Schema" in d
         assert "Source" in d
 
+    def test_pdf_dict_cached(self, full_table_datadef: DataDef) -> None:
+        view = full_table_datadef.pdf_dict
+        assert full_table_datadef.pdf_dict is view
+        assert {**view, "Rect": list(view["Rect"])} == full_table_datadef.to_pdf_dict()
+        with pytest.raises(TypeError):
+            view["Source"] = "x"  # type: ignore[index]
+        full_table_datadef.source = "Other"
+        assert full_table_datadef.pdf_dict["Source"] == "Other"
+
+    def test_pdf_dict_rect_immutable(self) -> None:
+        dd = DataDefBuilder.value().bind_to_page(1, rect=(1.0, 2.0, 3.0, 4.0)).build({})
+        with pytest.raises(AttributeError):
+            dd.pdf_dict["Rect"].append(99)
+        rect = dd.to_pdf_dict()["Rect"]
+        rect.append(99)
+        assert dd.to_pdf_dict()["Rect"] == [1.0, 2.0, 3.0, 4.0]
+        assert dd.pdf_dict["Rect"] == (1.0, 2.0, 3.0, 4.0)
+
+    def test_has_binding_follows_updates(self, minimal_datadef: DataDef) -> None:
+        assert not minimal_datadef.has_binding()
+        minimal_datadef.page_ref = 2
+        assert minimal_datadef.has_binding()
+
+    def test_repr_follows_updates(self, full_table_datadef: DataDef) -> None:
+        assert repr(full_table_datadef) is repr(full_table_datadef)
+        assert "'SDL Provenance'" in repr(full_table_datadef)
+        full_table_datadef.schema_uri = None
+        assert "'SDL Basic'" in repr(full_table_datadef)
+
+    def test_to_pdf_dict_created(self) -> None:
+        dd = DataDef(
+            data_type=DataType.VALUE, format=DataFormat.JSON, data="{}",
+            created=datetime(2025, 3, 4, 5, 6, 7, tzinfo=timezone.utc),
+        )
+        assert dd.to_pdf_dict()["Created"] == "D:20250304050607+00'00'"
+
     def test_dict_accepts_data(self) -> None:
         dd = DataDefBuilder.record().build({"name": "test", "value": 42})
         assert isinstance(dd.data, str)
         parsed = dd.data_as_dict()
         assert parsed["name"] == "test"
 
+    def test_hash_value_algorithm(self) -> None:
+        assert HashValue(algorithm="SHA-384", value="ab").algorithm == "SHA-384"
+        with pytest.raises(ValidationError):
+            HashValue(algorithm="MD5", value="ab")
+
+    def test_from_trusted(self, minimal_datadef: DataDef) -> None:
+        fields = dict(minimal_datadef)
+        dd = DataDef.from_trusted(**fields)
+        assert dd == minimal_datadef
+        assert dd.model_fields_set == set(fields)
+        partial = DataDef.from_trusted(data_type=DataType.VALUE, format=DataFormat.JSON, data="{}")
+        assert partial.encoding == "UTF-8"
+        assert partial.model_dump() == DataDef(**partial.model_dump()).model_dump()
+        assert dd.conformance_level() == minimal_datadef.conformance_level()
+
+    def test_from_trusted_matches_model_construct(self) -> None:
+        # from_trusted() writes pydantic's instance state directly; this fails
+        # if a pydantic release changes what model_construct() sets up.
+        fields = dict(data_type=DataType.VALUE, format=DataFormat.JSON, data="{}", source="ERP")
+        fast, ref = DataDef.from_trusted(**fields), DataDef.model_construct(**fields)
+        assert fast.__getstate__() == ref.__getstate__()
+        with pytest.raises(TypeError, match="souce"):
+            DataDef.from_trusted(**fields, souce="typo")
+        with pytest.raises(TypeError, match="format"):
+            DataDef.from_trusted(data_type=DataType.VALUE, data="{}")
+
+    def test_data_field(self) -> None:
+        data = '{"rows": [{"label": "Revenue"}], "a/b": {"n": NaN}}'
+        dd = DataDef(data_type=DataType.TABLE, format=DataFormat.JSON, data=data)
+        assert dd.data_field("/rows/0") == {"label": "Revenue"}
+        assert dd.data_field("/rows/0/label") == "Revenue"
+        with pytest.raises(KeyError):
+            dd.data_field("/rows/1")
+        payload = {"rows": [{"label": "Revenue"}], "a/b": {"n": 1}}
+        built = DataDefBuilder.table().build(payload)
+        assert built.data_field("/a~1b/n") == 1
+        assert built.data_field("") == payload
+
+    def test_data_field_simdjson(self) -> None:
+        pytest.importorskip("simdjson")
+        from pdf_sdl.models import datadef as datadef_mod
+
+        dd = DataDefBuilder.table().build({"rows": [{"label": "Revenue"}], "n": [1, 2]})
+        for _ in range(3):  # the thread's parser is reused across calls
+            assert dd.data_field("/rows/0") == {"label": "Revenue"}
+            assert dd.data_field("/n") == [1, 2]
+            with pytest.raises(KeyError):
+                dd.data_field("/rows/1")
+        assert datadef_mod._simdjson_parser() is datadef_mod._simdjson_parser()
+
+    def test_typed_data(self, link_datadef: DataDef, minimal_datadef: DataDef) -> None:
+        link = link_datadef.typed_data()
+        assert isinstance(link, LinkData)
+        assert link.link_id == link_datadef.data_as_dict()["linkId"]
+        assert minimal_datadef.typed_data() == minimal_datadef.data_as_dict()
+        bad = DataDefBuilder.provenance().build({"contentOrigin": "unknown"})
+        with pytest.raises(ValidationError):
+            bad.typed_data()
+        parsed = DataDef(data_type=DataType.LINK, format=DataFormat.JSON, data=link_datadef.data)
+        assert parsed.typed_data() == link
+
     def test_all_25_datatypes_constructible(self) -> None:
         """Verify all 25 DataTypes can be instantiated."""
         factory_methods = [
@@ -334,6 +480,126 @@ class TestDataDefBuilder:
         dd = DataDefBuilder.record().build('{"name": "test"}')
         assert dd.data_as_dict()["name"] == "test"
 
+    def test_builder_uses_slots(self) -> None:
+        b = DataDefBuilder.table()
+        assert not hasattr(b, "__dict__")
+        with pytest.raises(AttributeError):
+            b._typo = 1  # type: ignore[attr-defined]
+
+    def test_short_strings_interned(self) -> None:
+        a = DataDefBuilder.table().with_source("".join(["S", "AP"])).build({"rows": []})
+        b = DataDefBuilder.table().with_source("".join(["SA", "P"])).build({"rows": []})
+        assert a.source is b.source
+        uri = "https://example.com/schemas/" + "x" * 80
+        c = (
+            DataDefBuilder.table()
+            .with_schema("".join([uri]))
+            .trust_author("".join(["G"]))
+            .build({})
+        )
+        d = DataDefBuilder.custom("".join([uri, ""])).trust_author("G").build({})
+        assert c.schema_uri is d.schema_uri
+        assert c.generator is d.generator
+
+    def test_table_batch(self) -> None:
+        class Columnar:
+            def to_pylist(self) -> list[dict[str, int]]:
+                return [{"a": 1}, {"a": 2}]
+
+        tpl = DataDefBuilder.record().with_source("ERP").freeze_template()
+        dds = DataDefBuilder.table_batch(Columnar(), tpl)
+        assert [dd.data_as_dict()["a"] for dd in dds] == [1, 2]
+        assert DataDefBuilder.table_batch([{"a": 3}], tpl)[0].source == "ERP"
+
+    def test_enriched_confidence_normalized(self) -> None:
+        dd = DataDefBuilder.table().trust_enriched("m", 1).build_unchecked({})
+        assert isinstance(dd.confidence, float)
+        with pytest.raises(ValueError):
+            DataDefBuilder.table().trust_enriched("m", float("nan"))
+
+    def test_build_unchecked_matches_build(self) -> None:
+        builder = DataDefBuilder.table().with_source("SAP").trust_author("App").bind_to_page(2)
+        fast, checked = builder.build_unchecked({"rows": [1]}), builder.build({"rows": [1]})
+        assert fast.model_dump() == checked.model_dump()
+        assert fast.conformance_level() == checked.conformance_level()
+        assert fast.data_as_dict() == {"rows": [1]}
+
+    def test_build_tuple_and_dict_subclass(self) -> None:
+        from collections import OrderedDict
+
+        assert DataDefBuilder.series().build((1, 2)).data_as_dict() == [1, 2]
+        dd = DataDefBuilder.record().build(OrderedDict(a=1))
+        assert json.loads(dd.data) == {"a": 1}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_build_same_stream_without_orjson(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import pdf_sdl.builder.datadef_builder as builder_mod
+
+        if not use_orjson:
+            monkeypatch.setattr(builder_mod, "orjson", None)
+        dd = DataDefBuilder.table().build({"acct": 2**70, "v": float("nan")})
+        assert dd.data == '{"acct":1180591620717411303424,"v":null}'
+
+    def test_build_many(self) -> None:
+        builder = DataDefBuilder.value().with_source("ERP").bind_to_page(4)
+        dds = builder.build_many([{"v": 1}, {"v": 2}, '{"v": 3}'])
+        assert [dd.data_as_dict()["v"] for dd in dds] == [1, 2, 3]
+        assert all(dd.page_ref == 4 and dd.source == "ERP" for dd in dds)
+        unchecked = builder.build_many([{"v": 1}], validate=False)[0]
+        assert unchecked.model_dump() == dds[0].model_dump()
+
+    def test_bind_to_page_rect(self) -> None:
+        dd = DataDefBuilder.value().bind_to_page_rect(3, 0.0, 0.0, 10.0, 20.0).build({})
+        assert dd.page_ref == 3
+        assert dd.rect == (0.0, 0.0, 10.0, 20.0)
+
+    def test_template_round_trip(self) -> None:
+        tpl = DataDefBuilder.table().with_source("SAP").trust_author("App").freeze_template()
+        dd1 = DataDefBuilder.from_template(tpl).bind_to_page(1).build({"rows": []})
+        dd2 = DataDefBuilder.from_template(tpl).bind_to_page(2).build({"rows": []})
+        assert (dd1.page_ref, dd2.page_ref) == (1, 2)
+        assert dd1.source == dd2.source == "SAP"
+        assert dd1.trust_level == TrustLevel.AUTHOR
+        assert DataDefBuilder.from_template(tpl).freeze_template() == tpl
+        with pytest.raises(ValueError):
+            DataDefBuilder.from_template(tpl[:-1])
+
+    def test_custom_without_schema_fails_before_serializing(self) -> None:
+        builder = DataDefBuilder(DataType.CUSTOM)
+        with pytest.raises(ValueError, match="schema_uri"):
+            builder.build({"x": object()})
+
+    def test_injected_clock(self) -> None:
+        from pdf_sdl.builder import authoring_clock
+
+        pinned = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        with authoring_clock(pinned):
+            a = DataDefBuilder.table().trust_author("App").build({"rows": []})
+            b = DataDefBuilder.table().trust_enriched("AI", confidence=0.5).build({"rows": []})
+        assert a.created == pinned
+        assert b.created == pinned
+
+    def test_authoring_clock(self) -> None:
+        from pdf_sdl.builder import authoring_clock
+
+        outer = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        inner = datetime(2024, 7, 1, tzinfo=timezone.utc)
+        with authoring_clock(outer):
+            with authoring_clock(inner):
+                assert DataDefBuilder.table().trust_author("App").build({}).created == inner
+            assert DataDefBuilder.table().trust_author("App").build({}).created == outer
+        assert DataDefBuilder.table().trust_author("App").build({}).created != outer
+
+    def test_build_compact_by_default(self) -> None:
+        dd = DataDefBuilder.record().build({"name": "test", "tags": ["a", "b"]})
+        assert dd.data == '{"name":"test","tags":["a","b"]}'
+
+    def test_with_pretty(self) -> None:
+        dd = DataDefBuilder.record().with_pretty().build({"name": "test"})
+        assert dd.data == '{\n  "name": "test"\n}'
+
     # --- New DataType builder tests (v1.4.0) ---
 
     def test_process_datatype(self) -> None:
@@ -520,6 +786,20 @@ class TestLinkMeta:
         assert lm.version == 1
         assert lm.ref_date is not None
 
+    def test_ref_date_format_and_override(self) -> None:
+        lm = LinkMetaBuilder().build()
+        assert re.fullmatch(r"D:\d{14}\+00'00'", lm.ref_date)
+        lm = LinkMetaBuilder().context(ref_date="D:20240101000000+00'00'").build()
+        assert lm.ref_date == "D:20240101000000+00'00'"
+
+    def test_builder_uses_slots(self) -> None:
+        assert not hasattr(LinkMetaBuilder(), "__dict__")
+
+    def test_identical_hashes_shared(self) -> None:
+        a = LinkMetaBuilder().integrity("ab" * 32).build()
+        b = LinkMetaBuilder().integrity("ab" * 32).build()
+        assert a.hash is b.hash
+
     def test_full_linkmeta(self, full_linkmeta: LinkMeta) -> None:
         assert full_linkmeta.has_persistent_id()
         assert full_linkmeta.has_integrity()
@@ -718,6 +998,18 @@ class TestLinkMetaValidator:
 class TestPDFRoundTrip:
     """Tests for writing and reading DataDefs in actual PDF files."""
 
+    def test_pdf_io_imported_on_first_use(self) -> None:
+        import subprocess
+
+        code = (
+            "import sys, pdf_sdl\n"
+            "assert 'pikepdf' not in sys.modules\n"
+            "from pdf_sdl import SDLReader\n"
+            "assert 'pikepdf' in sys.modules and SDLReader.__name__ == 'SDLReader'\n"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert proc.returncode == 0, proc.stderr
+
     @pytest.fixture
     def tmp_pdf(self) -> Path:
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
@@ -757,6 +1049,62 @@ class TestPDFRoundTrip:
             found = reader.find_datadefs()
             assert len(found) == 3
 
+    def test_add_datadefs_batch(self, tmp_pdf: Path) -> None:
+        dds = [DataDefBuilder.value().build({"value": i}) for i in range(3)]
+        with SDLWriter() as writer:
+            refs = writer.add_datadefs(dds, page=1)
+            assert len(refs) == 3
+            assert len(writer.pdf.pages[0]["/DataDefs"]) == 3
+            writer.save(tmp_pdf)
+        with SDLReader(tmp_pdf) as reader:
+            assert reader.get_datadef_count() == 3
+
+    def test_build_into(self, tmp_pdf: Path) -> None:
+        with SDLWriter() as writer:
+            dd = DataDefBuilder.table().build_into({"rows": [1, 2]}, writer, page=1)
+            writer.save(tmp_pdf)
+        assert dd.data_as_dict() == {"rows": [1, 2]}
+        with SDLReader(tmp_pdf) as reader:
+            found = reader.find_datadefs()
+            assert len(found) == 1
+            assert found[0].data_as_dict() == {"rows": [1, 2]}
+
+    def test_cbor_round_trip(self, tmp_pdf: Path) -> None:
+        pytest.importorskip("cbor2")
+        payload = {"rows": [{"label": "Revenue", "value": 4200000}]}
+        dd = DataDefBuilder.table(DataFormat.CBOR).build(payload)
+        assert isinstance(dd.data, bytes)
+        assert DataDefValidator().validate(dd).passed
+        assert DataDef.model_validate_json(dd.model_dump_json()).data == dd.data
+        with SDLWriter() as writer:
+            writer.add_datadef(dd, page=1)
+            writer.save(tmp_pdf)
+        with SDLReader(tmp_pdf) as reader:
+            found = reader.find_datadefs()
+            assert found[0].format == DataFormat.CBOR
+            assert found[0].data_as_dict() == payload
+
+    def test_iter_datadefs_matches_find(self, tmp_pdf: Path) -> None:
+        with SDLWriter() as writer:
+            writer.add_datadefs([DataDefBuilder.value().build({"v": i}) for i in range(3)], page=1)
+            writer.save(tmp_pdf)
+        with SDLReader(tmp_pdf) as reader:
+            it = reader.iter_datadefs()
+            assert next(it).data_as_dict() == {"v": 0}
+            assert [dd.data for dd in reader.find_datadefs()] == [
+                dd.data for dd in reader.iter_datadefs()
+            ]
+
+    def test_in_memory_round_trip(self) -> None:
+        buf = io.BytesIO()
+        with SDLWriter() as writer:
+            writer.add_datadef(DataDefBuilder.value().build({"value": 1}))
+            writer.save(buf)
+        buf.seek(0)
+        with SDLReader(buf) as reader:
+            assert reader.get_datadef_count() == 1
+            assert reader.summary()["source"] == "<stream>"
+
     def test_read_from_existing_pdf_no_sdl(self) -> None:
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
             tmp = Path(f.name)
@@ -815,6 +1163,113 @@ class TestPDFRoundTrip:
             assert "Table" in summary["datatype_breakdown"]
             assert "Provenance" in summary["datatype_breakdown"]
 
+    def test_parse_linkmeta_shares_hash(self, tmp_pdf: Path) -> None:
+        import pikepdf
+
+        with SDLWriter() as writer:
+            writer.save(tmp_pdf)
+        raw = pikepdf.Dictionary(
+            Type=pikepdf.Name("/LinkMeta"),
+            LinkID=pikepdf.String("linkid:abc"),
+            TrustLevel=pikepdf.Name("/Author"),
+            Hash=pikepdf.Dictionary(
+                Algorithm=pikepdf.Name("/SHA-256"), Value=pikepdf.String("ab" * 32)
+            ),
+        )
+        with SDLReader(tmp_pdf) as reader:
+            lm1 = reader._parse_linkmeta(raw)
+            lm2 = reader._parse_linkmeta(raw)
+        assert lm1 is not None and lm2 is not None
+        assert lm1.link_id == "linkid:abc" and lm1.trust_level == "Author"
+        assert lm1.hash is lm2.hash
+
+
+# ===========================================================================
+# CLI Tests
+# ===========================================================================
+
+class TestCLI:
+    """Smoke tests for the pdf-sdl command-line interface."""
+
+    @pytest.fixture
+    def sdl_pdf(self, tmp_path: Path) -> Path:
+        blank, pdf = tmp_path / "blank.pdf", tmp_path / "doc.pdf"
+        with SDLWriter() as writer:
+            writer.save(blank)
+        result = CliRunner().invoke(
+            cli,
+            ["inject", str(blank), "--type", "table", "--page", "1", "-o", str(pdf),
+             "--data-inline", '{"rows": [{"label": "Revenue", "value": 1}]}'],
+        )
+        assert result.exit_code == 0, result.output
+        return pdf
+
+    def test_inject_inline_beyond_orjson(self, tmp_path: Path) -> None:
+        blank, out = tmp_path / "b.pdf", tmp_path / "o.pdf"
+        with SDLWriter() as writer:
+            writer.save(blank)
+        result = CliRunner().invoke(
+            cli,
+            ["inject", str(blank), "--type", "value", "-o", str(out),
+             "--data-inline", '{"acct": 1180591620717411303424, "v": NaN}'],
+        )
+        assert result.exit_code == 0, result.output
+        with SDLReader(out) as reader:
+            assert reader.find_datadefs()[0].data_as_dict() == {"acct": 2**70, "v": None}
+
+    def test_inject_large_data_file(self, tmp_path: Path) -> None:
+        from pdf_sdl.cli import main as cli_main
+
+        blank, out, data = tmp_path / "b.pdf", tmp_path / "o.pdf", tmp_path / "d.json"
+        with SDLWriter() as writer:
+            writer.save(blank)
+        rows = [{"i": i, "label": "x" * 20} for i in range(3000)]
+        rows[0]["i"] = 2**70  # beyond orjson, read by the json fallback
+        data.write_text(json.dumps({"rows": rows}), encoding="utf-8")
+        assert data.stat().st_size >= cli_main._MMAP_THRESHOLD
+        result = CliRunner().invoke(
+            cli, ["inject", str(blank), "--type", "series", "--data", str(data), "-o", str(out)]
+        )
+        assert result.exit_code == 0, result.output
+        with SDLReader(out) as reader:
+            rows = reader.find_datadefs()[0].data_as_dict()["rows"]
+            assert len(rows) == 3000 and rows[0]["i"] == 2**70
+
+    def test_validate_json_output(self, sdl_pdf: Path) -> None:
+        result = CliRunner().invoke(cli, ["validate", str(sdl_pdf), "--json-output"])
+        output = json.loads(result.output)
+        assert output["datadef_count"] == 1
+        assert output["results"][0]["type"] == "DataDef"
+
+    def test_rich_output(self, sdl_pdf: Path) -> None:
+        result = CliRunner().invoke(cli, ["validate", str(sdl_pdf)])
+        assert "DataDef Results" in result.output
+        result = CliRunner().invoke(cli, ["inspect", str(sdl_pdf)])
+        assert result.exit_code == 0, result.output
+        assert "DataDef Objects" in result.output
+        assert "Revenue" in result.output
+
+    def test_inspect_json(self, sdl_pdf: Path) -> None:
+        result = CliRunner().invoke(cli, ["inspect", str(sdl_pdf), "--format", "json"])
+        assert result.exit_code == 0, result.output
+        output = json.loads(result.output)
+        assert output["datadefs"][0]["data_type"] == "Table"
+        assert output["summary"]["datadef_count"] == 1
+
+    def test_json_output_skips_rich(self, sdl_pdf: Path) -> None:
+        import subprocess
+
+        code = (
+            "import sys\n"
+            "from pdf_sdl.cli.main import cli\n"
+            f"try: cli(['validate', {str(sdl_pdf)!r}, '--json-output'])\n"
+            "except SystemExit: pass\n"
+            "assert not any(m.startswith('rich') for m in sys.modules)\n"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert proc.returncode == 0, proc.stderr
+        assert json.loads(proc.stdout)["datadef_count"] == 1
+
 
 # ===========================================================================
 # Spec Compliance Tests (§10 Test Suite Outline)
@@ -916,6 +1371,9 @@ class TestSpecComplianceOutline:
         d = dd.data_as_dict()
         assert d["contentOrigin"] == "ai-generated"
         assert d["humanReviewed"] is True
+        assert ProvenanceData.model_validate(d).content_origin == "ai-generated"
+        with pytest.raises(ValidationError):
+            ProvenanceData.model_validate({"contentOrigin": "generated"})
 
     def test_classification_datatype(self) -> None:
         """§10: Classification DataType – Confidentiality levels."""